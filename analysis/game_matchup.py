@@ -1,18 +1,20 @@
 import argparse
 import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
 
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy import text
+from sqlalchemy import column, select, table, text
 from sqlalchemy.orm import Session
 
 try:
-    from db.database import get_engine, get_session_maker
+    from db.database import copy_rows, get_engine, get_session_maker
     from db.models import GameMatchup
     from db.db_extract import (
-        fetch_schedule_for_date,
-        load_team_stats_map,
-        compute_league_baselines,
+        build_nickname_index,
+        fetch_matchup_inputs,
+        fetch_schedule_for_dates,
         resolve_team_record,
     )
 except ImportError:
@@ -23,12 +25,12 @@ except ImportError:
     ROOT = Path(__file__).resolve().parents[1]
     if str(ROOT) not in sys.path:
         sys.path.insert(0, str(ROOT))
-    from db.database import get_engine, get_session_maker  # type: ignore
+    from db.database import copy_rows, get_engine, get_session_maker  # type: ignore
     from db.models import GameMatchup  # type: ignore
     from db.db_extract import (  # type: ignore
-        fetch_schedule_for_date,
-        load_team_stats_map,
-        compute_league_baselines,
+        build_nickname_index,
+        fetch_matchup_inputs,
+        fetch_schedule_for_dates,
         resolve_team_record,
     )
 
@@ -39,36 +41,97 @@ TIMEFRAMES = {
     "l5": "last_5",
     "l3": "last_3",
 }
+_TF_ITEMS = tuple(TIMEFRAMES.items())
+
+
+# Max rows per executemany batch when upserting game_matchup
+_UPSERT_BATCH_SIZE = 500
+
+# Columns refreshed from EXCLUDED on conflict (identity/creation columns are kept)
+_UPSERT_COLS = tuple(
+    c.name for c in GameMatchup.__table__.columns if c.name not in ("id", "created_at")
+)
+
+# Per-timeframe output fields, in GameMatchup column order
+_FIELDS = (
+    "pace",
+    "opp_pace",
+    "lg_pace",
+    "poss_above_lg",
+    "implied_poss",
+    "offrtg",
+    "defrtg",
+    "opp_offrtg",
+    "opp_defrtg",
+    "lg_pp100",
+    "hca_poss_adj",
+    "hca_pp100_adj",
+    "exp_pp100",
+    "opp_exp_pp100",
+    "proj_pts",
+    "opp_proj_pts",
+    "proj_total",
+    "matchup",
+    "pts_allowed_pg",
+)
+
+# Column names per horizon, e.g. _SUFFIXED["l10"][0] == "pace_l10"
+_SUFFIXED = {h: tuple(f"{field}_{h}" for field in _FIELDS) for h in TIMEFRAMES}
+
+# Row dict keys in column order, as produced by _build_rows
+_ROW_COLS = (
+    "game_date_est",
+    "team_name",
+    "opp_team_name",
+    "is_home",
+    "team_id",
+    "opp_team_id",
+    "calc_version",
+) + tuple(name for h in TIMEFRAMES for name in _SUFFIXED[h])
+
+# Database URLs whose analysis schema/table/index DDL has already been applied
+_BOOTSTRAPPED: Set[str] = set()
+
+# Session-local staging table used by run_range's COPY path
+_STAGE_TABLE = table("game_matchup_stage", *(column(c) for c in _ROW_COLS))
+
+# Team stat inputs read from each timeframe record
+_INPUT_KEYS = ("pace", "offrtg", "defrtg")
+# Input values for a horizon with no stats record (fixed shape, built once)
+_EMPTY_INPUTS = (None,) * len(_INPUT_KEYS)
+
+
+def _compute_horizon_vec(
+    team: Dict[str, np.ndarray],
+    opp: Dict[str, np.ndarray],
+    lg_pace: np.ndarray,
+    lg_pp100: np.ndarray,
+    is_home: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute horizon metrics for every row/timeframe at once.
+
+    team/opp map pace/offrtg/defrtg to (n_rows, n_horizons) arrays, lg_pace/lg_pp100
+    are (n_horizons,) league baselines and is_home is an (n_rows,) bool array.
+    Returns an (n_rows, n_horizons, len(_FIELDS)) array, fields in _FIELDS order,
+    rounded to 2 decimals.
+    """
+    shape = team["pace"].shape
 
-
-def _r2(v):
-    if v is None:
-        return None
-    try:
-        return round(float(v), 2)
-    except Exception:
-        return None
-
-
-def _compute_horizon(
-    team: Dict[str, float],
-    opp: Dict[str, float],
-    lg_pace: float,
-    lg_pp100: float,
-    is_home: bool,
-) -> Dict[str, Optional[float]]:
     # HCA adjustments
-    hca_poss_adj = 0.3 if is_home else -0.3
-    hca_pp100_adj = 0.5 if is_home else -0.5
+    hca_poss_adj = np.broadcast_to(np.where(is_home, 0.3, -0.3)[:, None], shape)
+    hca_pp100_adj = np.broadcast_to(np.where(is_home, 0.5, -0.5)[:, None], shape)
     opp_hca_poss_adj = -hca_poss_adj
     opp_hca_pp100_adj = -hca_pp100_adj
 
-    team_pace = float(team.get("pace") or 0.0)
-    opp_pace = float(opp.get("pace") or 0.0)
-    team_offrtg = float(team.get("offrtg") or 0.0)
-    team_defrtg = float(team.get("defrtg") or 0.0)
-    opp_offrtg = float(opp.get("offrtg") or 0.0)
-    opp_defrtg = float(opp.get("defrtg") or 0.0)
+    team_pace = team["pace"]
+    opp_pace = opp["pace"]
+    team_offrtg = team["offrtg"]
+    team_defrtg = team["defrtg"]
+    opp_offrtg = opp["offrtg"]
+    opp_defrtg = opp["defrtg"]
+    lg_pace = np.broadcast_to(lg_pace, shape)
+    lg_pp100 = np.broadcast_to(lg_pp100, shape)
 
     team_pace_adj = team_pace + hca_poss_adj
     opp_pace_adj = opp_pace + opp_hca_poss_adj
@@ -89,99 +152,149 @@ def _compute_horizon(
 
     pts_allowed_pg = team_defrtg * team_pace / 100.0
 
-    return {
-        "pace": _r2(team_pace),
-        "opp_pace": _r2(opp_pace),
-        "lg_pace": _r2(lg_pace),
-        "poss_above_lg": _r2(poss_above_lg),
-        "implied_poss": _r2(implied_poss),
-        "offrtg": _r2(team_offrtg),
-        "defrtg": _r2(team_defrtg),
-        "opp_offrtg": _r2(opp_offrtg),
-        "opp_defrtg": _r2(opp_defrtg),
-        "lg_pp100": _r2(lg_pp100),
-        "hca_poss_adj": _r2(hca_poss_adj),
-        "hca_pp100_adj": _r2(hca_pp100_adj),
-        "exp_pp100": _r2(exp_pp100),
-        "opp_exp_pp100": _r2(opp_exp_pp100),
-        "proj_pts": _r2(proj_pts),
-        "opp_proj_pts": _r2(opp_proj_pts),
-        "proj_total": _r2(proj_total),
-        "matchup": _r2(matchup),
-        "pts_allowed_pg": _r2(pts_allowed_pg),
-    }
-
-
-def _suffixize(prefix: str, h: str) -> str:
-    return f"{prefix}_{h}"
+    # Stack in _FIELDS order, then round to 2 dp in place (scale, rint, unscale)
+    # so the freshly stacked buffer is reused instead of allocating temporaries
+    out = np.stack(
+        [
+            team_pace,
+            opp_pace,
+            lg_pace,
+            poss_above_lg,
+            implied_poss,
+            team_offrtg,
+            team_defrtg,
+            opp_offrtg,
+            opp_defrtg,
+            lg_pp100,
+            hca_poss_adj,
+            hca_pp100_adj,
+            exp_pp100,
+            opp_exp_pp100,
+            proj_pts,
+            opp_proj_pts,
+            proj_total,
+            matchup,
+            pts_allowed_pg,
+        ],
+        axis=-1,
+    )
+    np.multiply(out, 100.0, out=out)
+    np.rint(out, out=out)
+    np.divide(out, 100.0, out=out)
+    return out
+
+
+class TeamPayload(NamedTuple):
+    """One team's identity plus (pace, offrtg, defrtg) per horizon, in TIMEFRAMES order."""
+
+    team_name: str
+    team_id: Optional[int]
+    inputs: Tuple[Optional[Tuple[Optional[float], ...]], ...]
+
+
+def _pick_team(
+    team_maps: Dict[str, Dict[str, dict]],
+    name: str,
+    nickname_indexes: Optional[Dict[str, Dict[str, List[str]]]] = None,
+) -> TeamPayload:
+    # Compose a record aggregating all timeframes for a single team, using alias resolution.
+    # Every timeframe map is keyed by the same normalized NBA team names, so the key
+    # resolved once is reused as a direct lookup; full resolution only runs on a miss.
+    team_id_val: Optional[int] = None
+    matched_key: Optional[str] = None
+    inputs: List[Optional[Tuple[Optional[float], ...]]] = []
+    for h_key, _ in _TF_ITEMS:
+        stats_map = team_maps[h_key]
+        rec = stats_map.get(matched_key) if matched_key is not None else None
+        if rec is None:
+            rec, key = resolve_team_record(
+                stats_map, name, nickname_indexes[h_key] if nickname_indexes else None
+            )
+            if key is not None:
+                matched_key = key
+        if rec is None:
+            inputs.append(None)
+            continue
+        inputs.append(tuple(rec.get(k) for k in _INPUT_KEYS))
+        if team_id_val is None:
+            team_id_val = rec.get("team_id")
+    return TeamPayload(name, team_id_val, tuple(inputs))
+
+
+def _stack_inputs(payloads: List[TeamPayload]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Stack pace/offrtg/defrtg from each payload's per-horizon inputs into
+    (n_rows, n_horizons) float arrays with a single conversion. Null stats become 0.0;
+    the returned mask flags timeframes with no record at all.
+    """
+    absent = np.array([[i is None for i in p.inputs] for p in payloads], dtype=bool)
+    raw = np.array(
+        [[_EMPTY_INPUTS if i is None else i for i in p.inputs] for p in payloads],
+        dtype=float,
+    )
+    raw = np.nan_to_num(raw, nan=0.0)
+    return {k: raw[:, :, i] for i, k in enumerate(_INPUT_KEYS)}, absent
 
 
-def _build_row(
+def _iter_rows(
     game_date: datetime.date,
-    team_side: str,
-    home_stats: Dict[str, dict],
-    away_stats: Dict[str, dict],
+    sides: List[Tuple[bool, TeamPayload, TeamPayload]],
     baselines: Dict[str, tuple],
-) -> Optional[dict]:
-    is_home = team_side == "home"
-    team = home_stats if is_home else away_stats
-    opp = away_stats if is_home else home_stats
-
-    # Require at least team and opp to exist in SL horizon to emit a row
-    if not team or not opp:
-        return None
-
-    base = {
-        "game_date_est": game_date,
-        "team_name": team.get("team_name"),
-        "opp_team_name": opp.get("team_name"),
-        "is_home": is_home,
-        "team_id": team.get("team_id"),
-        "opp_team_id": opp.get("team_id"),
-        "calc_version": "v1",
-    }
-
-    # For each timeframe/horizon, compute metrics if both sides present
-    for h_key, tf in TIMEFRAMES.items():
-        if team.get(tf) is None or opp.get(tf) is None:
-            # Populate empty fields for consistency
-            for field in (
-                "pace",
-                "opp_pace",
-                "lg_pace",
-                "poss_above_lg",
-                "implied_poss",
-                "offrtg",
-                "defrtg",
-                "opp_offrtg",
-                "opp_defrtg",
-                "lg_pp100",
-                "hca_poss_adj",
-                "hca_pp100_adj",
-                "exp_pp100",
-                "opp_exp_pp100",
-                "proj_pts",
-                "opp_proj_pts",
-                "proj_total",
-                "matchup",
-                "pts_allowed_pg",
-            ):
-                base[_suffixize(field, h_key)] = None
-            continue
-
-        lg_pace, lg_pp100 = baselines[h_key]
-        comp = _compute_horizon(team[tf], opp[tf], lg_pace, lg_pp100, is_home=is_home)
-        for field, value in comp.items():
-            base[_suffixize(field, h_key)] = value
-
-    return base
-
+) -> Iterator[tuple]:
+    """
+    Yield one GameMatchup row tuple, in _ROW_COLS order, per (is_home, team_payload,
+    opp_payload) entry in sides.
+    """
+    if not sides:
+        return
+
+    # Stack inputs into (n_rows, n_horizons) arrays; missing marks horizons
+    # where either side has no stats (emitted as None)
+    team, team_absent = _stack_inputs([s[1] for s in sides])
+    opp, opp_absent = _stack_inputs([s[2] for s in sides])
+    missing = team_absent | opp_absent
+    is_home = np.fromiter((s[0] for s in sides), dtype=bool, count=len(sides))
+
+    lg_pace = np.array([baselines[h][0] for h in TIMEFRAMES], dtype=float)
+    lg_pp100 = np.array([baselines[h][1] for h in TIMEFRAMES], dtype=float)
+    comp = _compute_horizon_vec(team, opp, lg_pace, lg_pp100, is_home)
+
+    # Flatten to (n_rows, n_horizons * n_fields) in _ROW_COLS order and blank out
+    # missing horizons (emitted as None) in one masked assignment
+    n_rows = len(sides)
+    metrics = comp.reshape(n_rows, -1).astype(object)
+    metrics[np.repeat(missing, len(_FIELDS), axis=1)] = None
+
+    for (home, team_payload, opp_payload), tail in zip(sides, metrics.tolist()):
+        yield (
+            game_date,
+            team_payload.team_name,
+            opp_payload.team_name,
+            home,
+            team_payload.team_id,
+            opp_payload.team_id,
+            "v1",
+            *tail,
+        )
 
-def run(game_date: datetime.date, database_url: Optional[str]) -> int:
-    engine = get_engine(database_url)
-    SessionLocal = get_session_maker(engine)
 
-    # Ensure schema/table exist in case create_tables wasn't run
+def _build_rows(
+    game_date: datetime.date,
+    sides: List[Tuple[bool, TeamPayload, TeamPayload]],
+    baselines: Dict[str, tuple],
+) -> List[dict]:
+    """
+    Build one GameMatchup row dict per (is_home, team_payload, opp_payload) entry in sides.
+    """
+    return [dict(zip(_ROW_COLS, row)) for row in _iter_rows(game_date, sides, baselines)]
+
+
+def _bootstrap(engine) -> None:
+    # Ensure schema/table exist in case create_tables wasn't run. The DDL is idempotent,
+    # so it only needs to run once per database per process.
+    key = str(engine.url)
+    if key in _BOOTSTRAPPED:
+        return
     with engine.begin() as conn:
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS analysis"))
         # If an old deferrable unique constraint exists, drop it; ON CONFLICT can't use it
@@ -197,79 +310,162 @@ def run(game_date: datetime.date, database_url: Optional[str]) -> int:
             )
         )
     GameMatchup.__table__.create(bind=engine, checkfirst=True)
+    _BOOTSTRAPPED.add(key)
+
+
+def _on_conflict_upsert(stmt):
+    # stmt.excluded is memoized per statement; index it as a mapping rather than
+    # going through attribute lookup for every column
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            GameMatchup.game_date_est,
+            GameMatchup.team_name,
+            GameMatchup.opp_team_name,
+        ],
+        set_={name: excluded[name] for name in _UPSERT_COLS},
+    )
 
-    with SessionLocal() as session:
-        # Load schedule
-        schedule = fetch_schedule_for_date(session, game_date)
-        if not schedule:
-            return 0
 
-        # Load team stats maps per timeframe and baselines
-        team_maps: Dict[str, Dict[str, dict]] = {}
-        baselines: Dict[str, tuple] = {}
-        for h_key, tf in TIMEFRAMES.items():
-            # Build maps keyed by normalized name, but we need to preserve two lookups (home/away)
-            raw_map = load_team_stats_map(session, tf)
-            # Build a two-level map: normalized_name -> per-timeframe dict
-            team_maps[h_key] = raw_map
-            baselines[h_key] = compute_league_baselines(session, tf)
+def _rows_for_date(session: Session, game_date: datetime.date) -> List[dict]:
+    # Load schedule, team stats maps and baselines for all timeframes in one round-trip
+    inputs = fetch_matchup_inputs(session, game_date, TIMEFRAMES.values())
+    # Compute all horizons for every team perspective in one vectorized pass
+    return _build_rows(game_date, *_sides_from_inputs(*inputs))
 
-        inserted = 0
-        rows_to_upsert = []
-        for g in schedule:
-            home_name = g["home_team"]
-            away_name = g["away_team"]
-
-            def pick(name: str) -> Dict[str, dict]:
-                # Compose a record aggregating all timeframes for a single team, using alias resolution
-                payload: Dict[str, dict] = {"team_name": name}
-                team_id_val: Optional[int] = None
-                for h_key, tf in TIMEFRAMES.items():
-                    stats_map = team_maps[h_key]
-                    rec, _ = resolve_team_record(stats_map, name)
-                    payload[tf] = rec
-                    if rec and team_id_val is None:
-                        team_id_val = rec.get("team_id")
-                if team_id_val is not None:
-                    payload["team_id"] = team_id_val
-                return payload
-
-            home_payload = pick(home_name)
-            away_payload = pick(away_name)
-
-            # Compute baselines per horizon once
-            base_map = {h: baselines[h] for h in TIMEFRAMES.keys()}
-
-            home_row = _build_row(game_date, "home", home_payload, away_payload, base_map)
-            away_row = _build_row(game_date, "away", home_payload, away_payload, base_map)
-            if home_row:
-                rows_to_upsert.append(home_row)
-            if away_row:
-                rows_to_upsert.append(away_row)
 
+def _sides_from_inputs(
+    schedule: List[dict],
+    stats_by_tf: Dict[str, Dict[str, dict]],
+    baselines_by_tf: Dict[str, tuple],
+) -> Tuple[List[Tuple[bool, TeamPayload, TeamPayload]], Dict[str, tuple]]:
+    """Resolve both perspectives of every scheduled game, plus baselines keyed by horizon."""
+    if not schedule:
+        return [], {}
+
+    team_maps: Dict[str, Dict[str, dict]] = {
+        h_key: stats_by_tf[tf] for h_key, tf in _TF_ITEMS
+    }
+    baselines: Dict[str, tuple] = {
+        h_key: baselines_by_tf[tf] for h_key, tf in _TF_ITEMS
+    }
+    # Tokenize each map's keys once for every team's nickname fallback
+    nickname_indexes: Dict[str, Dict[str, List[str]]] = {
+        h_key: build_nickname_index(stats_map) for h_key, stats_map in team_maps.items()
+    }
+
+    sides: List[Tuple[bool, TeamPayload, TeamPayload]] = []
+    for g in schedule:
+        home_name = g["home_team"]
+        away_name = g["away_team"]
+
+        home_payload = _pick_team(team_maps, home_name, nickname_indexes)
+        away_payload = _pick_team(team_maps, away_name, nickname_indexes)
+
+        sides.append((True, home_payload, away_payload))
+        sides.append((False, away_payload, home_payload))
+
+    return sides, baselines
+
+
+def run(
+    game_date: datetime.date, database_url: Optional[str], skip_bootstrap: bool = False
+) -> int:
+    # get_engine / get_session_maker are shared per URL, so repeated calls reuse
+    # the warm connection pool
+    engine = get_engine(database_url)
+    SessionLocal = get_session_maker(engine)
+
+    if not skip_bootstrap:
+        _bootstrap(engine)
+
+    with SessionLocal() as session:
+        rows_to_upsert = _rows_for_date(session, game_date)
         if not rows_to_upsert:
             return 0
 
-        # Upsert rows (avoid nested transactions on an already-active Session)
-        stmt = pg_insert(GameMatchup.__table__).values(rows_to_upsert)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=[
-                GameMatchup.game_date_est,
-                GameMatchup.team_name,
-                GameMatchup.opp_team_name,
-            ],
-            set_={
-                c.name: getattr(stmt.excluded, c.name)
-                for c in GameMatchup.__table__.columns
-                if c.name not in ("id", "created_at")
-            },
-        )
-        result = session.execute(stmt)
+        # Upsert rows in fixed-size executemany batches (avoid nested transactions
+        # on an already-active Session). The statement carries no inline VALUES so
+        # its compiled form is identical across batches and runs.
+        stmt = _on_conflict_upsert(pg_insert(GameMatchup.__table__))
+        inserted = 0
+        for start in range(0, len(rows_to_upsert), _UPSERT_BATCH_SIZE):
+            chunk = rows_to_upsert[start : start + _UPSERT_BATCH_SIZE]
+            session.execute(stmt, chunk)
+            # DO UPDATE touches every row (no WHERE), so each row counts as affected
+            inserted += len(chunk)
         session.commit()
-        inserted = getattr(result, "rowcount", 0) or 0
         return inserted
 
 
+def run_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    database_url: Optional[str],
+    skip_bootstrap: bool = False,
+) -> int:
+    """
+    Compute and upsert game_matchup rows for every date in [start_date, end_date].
+
+    Intended for backfills: rows for each date are COPY'd into a temp staging table
+    and merged with a single INSERT ... SELECT ... ON CONFLICT DO UPDATE, avoiding
+    per-row parameter binding. Inputs are read in two round-trips for the whole
+    range: every schedule at once, then the (date-independent) team stats and
+    baselines. Returns the number of rows upserted.
+    """
+    # get_engine / get_session_maker are shared per URL, so repeated calls reuse
+    # the warm connection pool
+    engine = get_engine(database_url)
+    SessionLocal = get_session_maker(engine)
+
+    if not skip_bootstrap:
+        _bootstrap(engine)
+
+    with SessionLocal() as session:
+        session.execute(
+            text(
+                f"CREATE TEMP TABLE {_STAGE_TABLE.name} "
+                "(LIKE analysis.game_matchup INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        conn = session.connection()
+        staged = 0
+        dates = [
+            start_date + datetime.timedelta(days=i)
+            for i in range((end_date - start_date).days + 1)
+        ]
+        # Every date's schedule in one round-trip
+        schedules = fetch_schedule_for_dates(session, dates)
+        game_dates = [d for d in dates if schedules[d]]
+        if game_dates:
+            # Team stats and baselines do not depend on the date, so one read
+            # serves the whole range
+            _, stats_by_tf, baselines_by_tf = fetch_matchup_inputs(
+                session, game_dates[0], TIMEFRAMES.values()
+            )
+            for game_date in game_dates:
+                # Row tuples stream straight into COPY without intermediate dicts
+                staged += copy_rows(
+                    conn,
+                    _STAGE_TABLE.name,
+                    _ROW_COLS,
+                    _iter_rows(
+                        game_date,
+                        *_sides_from_inputs(schedules[game_date], stats_by_tf, baselines_by_tf),
+                    ),
+                )
+
+        if staged:
+            stmt = _on_conflict_upsert(
+                pg_insert(GameMatchup.__table__).from_select(
+                    list(_ROW_COLS), select(*_STAGE_TABLE.c)
+                )
+            )
+            session.execute(stmt)
+        session.commit()
+        return staged
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Compute and upsert game matchup rows for a date.")
     parser.add_argument(
@@ -277,11 +473,21 @@ def main() -> None:
         default=None,
         help="Game date (EST) in YYYY-MM-DD. Defaults to today's date in America/New_York.",
     )
+    parser.add_argument(
+        "--end-date",
+        default=None,
+        help="Optional last game date (EST) in YYYY-MM-DD; computes every date from --date through it.",
+    )
     parser.add_argument(
         "--database-url",
         default=None,
         help="Database URL. If omitted, uses DATABASE_URL env var.",
     )
+    parser.add_argument(
+        "--skip-bootstrap",
+        action="store_true",
+        help="Skip the schema/table/index DDL checks (tables already created via db.create_tables).",
+    )
     args = parser.parse_args()
 
     if args.date:
@@ -290,7 +496,13 @@ def main() -> None:
         # Use today's local date (system timezone) as EST date surrogate
         game_date = datetime.date.today()
 
-    count = run(game_date, args.database_url)
+    if args.end_date:
+        end_date = datetime.datetime.strptime(args.end_date, "%Y-%m-%d").date()
+        count = run_range(game_date, end_date, args.database_url, args.skip_bootstrap)
+        print(f"Upserted/updated {count} game_matchup rows for {game_date} through {end_date}")
+        return
+
+    count = run(game_date, args.database_url, args.skip_bootstrap)
     print(f"Upserted/updated {count} game_matchup rows for {game_date}")
 
 
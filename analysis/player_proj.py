@@ -10,8 +10,13 @@ This module builds comprehensive player fantasy projections by:
 """
 import argparse
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import sys
 
 import pandas as pd
@@ -21,8 +26,8 @@ import numpy as np
 try:
     from db.database import get_engine, get_session_maker
     from db.db_extract import (
-        load_player_stats_dataframe,
-        load_team_stats_dataframe,
+        load_player_stats_dataframes_bulk,
+        load_team_stats_dataframes_bulk,
         load_game_matchup_dataframe,
     )
     from analysis.utils import DataUtils, NameMatcher
@@ -32,8 +37,8 @@ except ImportError:
         sys.path.insert(0, str(ROOT))
     from db.database import get_engine, get_session_maker  # type: ignore
     from db.db_extract import (  # type: ignore
-        load_player_stats_dataframe,
-        load_team_stats_dataframe,
+        load_player_stats_dataframes_bulk,
+        load_team_stats_dataframes_bulk,
         load_game_matchup_dataframe,
     )
     from analysis.utils import DataUtils, NameMatcher  # type: ignore
@@ -87,9 +92,29 @@ TEAM_ABB_TO_FULL = {
     'WAS': 'Washington Wizards',
 }
 
+# Daily projections CSV columns to keep, and their renamed names
+DAILY_PROJ_COLUMNS = {
+    'Name': 'player',
+    'Pos': 'pos',
+    'Team': 'team',
+    'Opp': 'opp',
+    'Salary': 'salary',
+    'Min': 'proj_mins',
+    'Adj Own': 'ownership',
+    'Status': 'status',
+}
+
 # Base stats to extract from player data
 BASE_STATS = ['gp', 'usg_pct', 'fp', 'touches', 'min', 'poss']
 
+# Daily projection columns stored as pandas categoricals
+CATEGORICAL_COLS = ('team', 'opp', 'pos', 'status')
+
+# Dtype for merged per-period stats and the metrics derived from them. These
+# columns are written as-is to the DOUBLE PRECISION projection table and the CSV,
+# so they stay float64: float32 would store values like 0.8333333134651184.
+STAT_DTYPE = np.float64
+
 # Projection method weights (higher = more importance)
 # TPM = Touches Per Minute method
 # IT = Implied Touches method
@@ -108,6 +133,35 @@ IT_WEIGHTS = {
 }
 
 
+# Fuzzy name matching threshold and on-disk memo of resolved names. The memo is
+# keyed on the matcher version, threshold and database player universe, so it is
+# reused until the roster or the matching logic changes.
+NAME_MATCH_THRESHOLD = 0.80
+NAME_MAP_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "nba_sharp"
+
+
+def _full_team_names(abbrevs: pd.Series) -> pd.Series:
+    """
+    Map categorical team abbreviations to full team names.
+    
+    map on a categorical looks each category up once rather than once per row.
+    Unmapped abbreviations become NaN. The result is a plain object Series: its
+    consumers are dict lookups (.map(...).fillna(...)), which gain nothing from a
+    categorical.
+    """
+    return abbrevs.map(TEAM_ABB_TO_FULL).astype(object)
+
+
+@lru_cache(maxsize=2)
+def _read_daily_csv(csv_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    # mtime_ns/size only key the cache, so a re-uploaded CSV is parsed again.
+    # Only parse the columns we keep; the export carries ~60 others
+    return pd.read_csv(
+        csv_path,
+        usecols=lambda col: col in DAILY_PROJ_COLUMNS or col.lower() == 'gameinfo',
+    )
+
+
 def load_daily_projections(csv_path: Path) -> pd.DataFrame:
     """
     Load the daily projections CSV and extract relevant columns.
@@ -123,34 +177,25 @@ def load_daily_projections(csv_path: Path) -> pd.DataFrame:
     - status
     - game_info (renamed from gameInfo)
     """
-    df = pd.read_csv(csv_path)
+    # Parsed once per file version; the selection/rename below builds a new frame,
+    # so the cached one is never modified
+    stat = os.stat(csv_path)
+    df = _read_daily_csv(str(csv_path), stat.st_mtime_ns, stat.st_size)
     
     # Extract and rename relevant columns
-    columns_map = {
-        'Name': 'player',
-        'Pos': 'pos',
-        'Team': 'team',
-        'Opp': 'opp',
-        'Salary': 'salary',
-        'Min': 'proj_mins',
-        'Adj Own': 'ownership',
-        'Status': 'status',
-    }
-    
-    # Check for gameInfo column (might be case-sensitive)
-    game_info_col = None
-    for col in df.columns:
-        if col.lower() == 'gameinfo':
-            game_info_col = col
-            break
+    columns_map = dict(DAILY_PROJ_COLUMNS)
+    
+    # Check for gameInfo column (might be case-sensitive); built in reverse so the
+    # first matching header wins
+    lower_to_col = {col.lower(): col for col in reversed(df.columns)}
+    game_info_col = lower_to_col.get('gameinfo')
     
     if game_info_col:
         columns_map[game_info_col] = 'game_info'
     
     # Select and rename columns
     available_cols = {k: v for k, v in columns_map.items() if k in df.columns}
-    df = df[list(available_cols.keys())].copy()
-    df = df.rename(columns=available_cols)
+    df = df[list(available_cols.keys())].rename(columns=available_cols)
     
     # Clean data
     df['player'] = df['player'].str.strip()
@@ -164,22 +209,29 @@ def load_daily_projections(csv_path: Path) -> pd.DataFrame:
         df['game_info'] = ''
     
     # Filter out players without salary info
-    initial_count = len(df)
-    df = df[df['salary'].notna()].copy()
-    no_salary_count = initial_count - len(df)
+    has_salary = df['salary'].notna()
+    no_salary_count = int((~has_salary).sum())
     if no_salary_count > 0:
         print(f"Filtered {no_salary_count} players with no salary info")
     
     # Filter out players with less than 15 projected minutes
-    before_mins_filter = len(df)
-    df = df[df['proj_mins'] >= 15].copy()
-    low_mins_count = before_mins_filter - len(df)
+    enough_mins = df['proj_mins'] >= 15
+    low_mins_count = int((has_salary & ~enough_mins).sum())
     if low_mins_count > 0:
         print(f"Filtered {low_mins_count} players with < 15 projected minutes")
     
+    # Apply both filters in one selection; reset_index hands back a frame that
+    # owns its rows, so the column writes below need no defensive copies
+    df = df[has_salary & enough_mins].reset_index(drop=True)
+    
+    # Low-cardinality string columns as categoricals: int codes instead of Python
+    # strings per row, and the categorical groupby path for team aggregations
+    for col in CATEGORICAL_COLS:
+        df[col] = df[col].astype('category')
+    
     # Map team abbreviations to full names for database lookups
-    df['team_full_name'] = df['team'].map(TEAM_ABB_TO_FULL)
-    df['opp_full_name'] = df['opp'].map(TEAM_ABB_TO_FULL)
+    df['team_full_name'] = _full_team_names(df['team'])
+    df['opp_full_name'] = _full_team_names(df['opp'])
     
     # Warn about unmapped teams
     unmapped_teams = df[df['team_full_name'].isna()]['team'].unique()
@@ -198,14 +250,10 @@ def load_all_player_stats(session) -> Dict[str, pd.DataFrame]:
     Load player stats for all time periods.
     
     Returns dict mapping period keys (sl, l10, l5, l3) to DataFrames.
+    All periods are read in one UNION ALL round-trip.
     """
-    player_dfs = {}
-    
-    for period_key, period_name in PERIOD_NAMES.items():
-        df = load_player_stats_dataframe(session, period_name)
-        player_dfs[period_key] = df
-    
-    return player_dfs
+    by_name = load_player_stats_dataframes_bulk(session, PERIOD_NAMES.values())
+    return {period_key: by_name[period_name] for period_key, period_name in PERIOD_NAMES.items()}
 
 
 def load_all_team_stats(session) -> Dict[str, pd.DataFrame]:
@@ -213,20 +261,47 @@ def load_all_team_stats(session) -> Dict[str, pd.DataFrame]:
     Load team stats for all time periods.
     
     Returns dict mapping period keys (sl, l10, l5, l3) to DataFrames.
+    All periods are read in one UNION ALL round-trip.
     """
-    team_dfs = {}
-    
-    for period_key, period_name in PERIOD_NAMES.items():
-        df = load_team_stats_dataframe(session, period_name)
-        team_dfs[period_key] = df
-    
-    return team_dfs
+    by_name = load_team_stats_dataframes_bulk(session, PERIOD_NAMES.values())
+    return {period_key: by_name[period_name] for period_key, period_name in PERIOD_NAMES.items()}
+
+
+def _name_map_cache_path(db_players) -> Path:
+    """Cache file for a given matcher version, match threshold and set of database player names."""
+    key_src = (
+        f"{NameMatcher.VERSION}\n{NAME_MATCH_THRESHOLD}\n" + "\n".join(sorted(set(db_players)))
+    )
+    key = hashlib.blake2b(key_src.encode("utf-8"), digest_size=8).hexdigest()
+    return NAME_MAP_CACHE_DIR / f"namemap_{key}.json"
+
+
+def _load_name_map_cache(path: Path) -> Dict[str, Optional[str]]:
+    """Load a memoized name map; a missing or unreadable file is treated as empty."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_name_map_cache(path: Path, name_map: Dict[str, Optional[str]]) -> None:
+    """Persist the name map; failures only cost a re-match on the next run."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(name_map, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not write name map cache {path}: {e}")
 
 
 def build_name_mapping(df: pd.DataFrame, player_dfs: Dict[str, pd.DataFrame]) -> Dict[str, str]:
     """
     Build a mapping from daily projection names to database player names
-    using fuzzy matching.
+    using fuzzy matching, memoized on disk per database player universe.
     
     Args:
         df: Daily projections DataFrame
@@ -241,8 +316,17 @@ def build_name_mapping(df: pd.DataFrame, player_dfs: Dict[str, pd.DataFrame]) ->
     # Get names from daily projections
     proj_players = df['player'].unique().tolist()
     
-    # Build mapping using fuzzy matching
-    name_map = NameMatcher.build_name_map(proj_players, db_players, threshold=0.80)
+    # Reuse names resolved on earlier runs against the same player universe and only
+    # fuzzy-match the rest (unmatched names are memoized too, as None)
+    cache_path = _name_map_cache_path(db_players)
+    resolved = _load_name_map_cache(cache_path)
+    pending = [p for p in proj_players if p not in resolved]
+    if pending:
+        fresh = NameMatcher.build_name_map(pending, db_players, threshold=NAME_MATCH_THRESHOLD)
+        resolved.update({p: fresh.get(p) for p in pending})
+        _save_name_map_cache(cache_path, resolved)
+    
+    name_map = {p: resolved[p] for p in proj_players if resolved[p] is not None}
     
     # Report unmapped names
     unmapped = [p for p in proj_players if p not in name_map]
@@ -268,22 +352,19 @@ def merge_player_stats(df: pd.DataFrame, player_dfs: Dict[str, pd.DataFrame]) ->
     # Map names in the daily projections to database names
     df['db_player'] = df['player'].map(name_map)
     
-    # For each period and stat, lookup values
+    # For each period, join all base stats in one hashed lookup. The first row per
+    # player wins (as with xlookup); unmatched players get 0.0 for every stat.
     for period in PERIODS:
         player_df = player_dfs[period]
+        stats = player_df.drop_duplicates('player').set_index('player')[BASE_STATS]
         
-        for stat in BASE_STATS:
-            col_name = f"{stat}_{period}"
-            
-            # For each row in df, lookup the stat value
-            df[col_name] = df['db_player'].apply(
-                lambda x: DataUtils.xlookup(
-                    x,
-                    player_df['player'],
-                    player_df[stat],
-                    if_not_found=0.0
-                ) if pd.notna(x) else 0.0
-            )
+        matched = df['db_player'].isin(stats.index).to_numpy()
+        values = np.where(
+            matched[:, None], stats.reindex(df['db_player']).to_numpy(dtype=STAT_DTYPE), 0.0
+        ).astype(STAT_DTYPE, copy=False)
+        
+        for i, stat in enumerate(BASE_STATS):
+            df[f"{stat}_{period}"] = values[:, i]
     
     return df
 
@@ -296,218 +377,145 @@ def handle_missing_data(df: pd.DataFrame) -> pd.DataFrame:
     If l5 is also zero, copy from l10, etc.
     Drop players with all zeros across all periods.
     """
-    # Work backwards from shortest to longest period
-    periods_reverse = ['l3', 'l5', 'l10', 'sl']
+    # Stack every period's base stats into one (n_players, n_periods, n_stats) block
+    # and find all-zero periods in a single comparison pass
+    all_period_cols = [f"{stat}_{period}" for period in PERIODS for stat in BASE_STATS]
+    block = df[all_period_cols].to_numpy().reshape(len(df), len(PERIODS), len(BASE_STATS))
+    zero = (block == 0).all(axis=2)
     
-    for i, period in enumerate(periods_reverse[:-1]):
-        next_period = periods_reverse[i + 1]
-        
-        # Check if all base stats for this period are zero
-        period_cols = [f"{stat}_{period}" for stat in BASE_STATS]
-        all_zero = (df[period_cols] == 0).all(axis=1)
-        
-        # Copy from next period for rows with all zeros
-        next_period_cols = [f"{stat}_{next_period}" for stat in BASE_STATS]
-        for period_col, next_col in zip(period_cols, next_period_cols):
-            df.loc[all_zero, period_col] = df.loc[all_zero, next_col]
+    # Each shorter period with all zeros takes the next longer period's values as
+    # loaded (l3 <- l5, l5 <- l10, l10 <- sl); PERIODS runs longest to shortest
+    filled = block.copy()
+    for i in range(1, len(PERIODS)):
+        filled[zero[:, i], i] = block[zero[:, i], i - 1]
+    df[all_period_cols] = filled.reshape(len(df), -1)
     
     # Drop players where all periods are still zero
-    all_period_cols = [f"{stat}_{period}" for period in PERIODS for stat in BASE_STATS]
-    all_zero_mask = (df[all_period_cols] == 0).all(axis=1)
+    all_zero_mask = (filled == 0).all(axis=(1, 2))
     
     if all_zero_mask.any():
         dropped_count = all_zero_mask.sum()
         print(f"Dropping {dropped_count} players with no historical data")
-        df = df[~all_zero_mask].copy()
-    
-    return df
-
-
-def calculate_rate_stats(df: pd.DataFrame, period: str) -> pd.DataFrame:
-    """
-    Calculate rate-based statistics for a specific period.
-    
-    Adds columns:
-    - fppm_{period}: Fantasy Points Per Minute
-    - fppt_{period}: Fantasy Points Per Touch
-    - fppp_{period}: Fantasy Points Per Possession
-    - tpm_{period}: Touches Per Minute
-    - tpp_{period}: Touches Per Possession
-    """
-    # Fantasy Points Per Minute
-    df[f'fppm_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'fp_{period}'],
-            row[f'min_{period}']
-        ),
-        axis=1
-    )
-    
-    # Fantasy Points Per Touch
-    df[f'fppt_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'fp_{period}'],
-            row[f'touches_{period}']
-        ),
-        axis=1
-    )
-    
-    # Fantasy Points Per Possession (per game possession)
-    df[f'fppp_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'fp_{period}'],
-            DataUtils.safe_divide(row[f'poss_{period}'], row[f'gp_{period}'], 1.0)
-        ),
-        axis=1
-    )
-    
-    # Touches Per Minute
-    df[f'tpm_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'touches_{period}'],
-            row[f'min_{period}']
-        ),
-        axis=1
-    )
-    
-    # Touches Per Possession (per game possession)
-    df[f'tpp_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'touches_{period}'],
-            DataUtils.safe_divide(row[f'poss_{period}'], row[f'gp_{period}'], 1.0)
-        ),
-        axis=1
-    )
+        df = df[~all_zero_mask].reset_index(drop=True)
     
     return df
 
 
-def calculate_team_context(
-    df: pd.DataFrame, 
-    team_dfs: Dict[str, pd.DataFrame],
-    period: str
-) -> pd.DataFrame:
-    """
-    Calculate team-level context statistics for a period.
-    
-    Adds columns:
-    - poss_pct_{period}: Player's possession percentage of team
-    """
-    team_df = team_dfs[period]
-    
-    # Get team possessions for each player using full team name
-    df[f'team_poss_{period}'] = df['team_full_name'].apply(
-        lambda x: DataUtils.xlookup(
-            x,
-            team_df['team_name'],
-            team_df['poss'],
-            if_not_found=0.0
-        ) if pd.notna(x) else 0.0
-    )
-    
-    # Calculate possession percentage (player's share of team possessions)
-    df[f'poss_pct_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'poss_{period}'],
-            row[f'team_poss_{period}']
-        ) * 100.0,
-        axis=1
-    )
-    
-    return df
-
-
-def calculate_touch_projections(
+def compute_period_block(
     df: pd.DataFrame,
+    period: str,
+    team_df: pd.DataFrame,
     matchup_df: pd.DataFrame,
-    period: str
-) -> pd.DataFrame:
+    team_fp: Optional[pd.Series] = None
+) -> Dict[str, np.ndarray]:
     """
-    Calculate implied touch projections using two methods.
-    
-    Adds columns:
-    - touches_ip_{period}: Implied Touches from Implied Possessions
-    - touches_tpm_{period}: Implied Touches from Touches Per Minute
+    Calculate all metrics for a period in one pass over the period's stat columns.
+    
+    Returns a dict of new columns (in output order), aligned with df's rows:
+    - fppm/fppt/fppp_{period}: Fantasy Points Per Minute / Touch / Possession
+    - tpm/tpp_{period}: Touches Per Minute / Possession
+    - team_poss_{period}, poss_pct_{period}: Team possessions and player's share
+    - implied_poss_{period}: Matchup implied possessions for the player's team
+    - touches_ip/touches_tpm_{period}: Implied Touches (implied poss / per minute)
+    - fp_proj_it/fp_proj_tpm_{period}: Fantasy Points from each touch method
+    - team_fp_{period}, fp_per_{period}: Team fantasy points and player's share
+    
+    team_fp may be passed in precomputed (see team_fp_totals); otherwise it is
+    summed here.
     """
-    # Merge matchup data for implied possessions
-    # Match on team name to get the implied_poss for this period
-    matchup_col = f'implied_poss_{period}'
+    # Lookups and the team groupby need pandas; everything else is array math.
+    # Mapping a categorical can return a categorical (pandas 2.x does when the
+    # mapping is one-to-one), which fillna(0.0) rejects, so cast to float first.
+    team_to_team_poss = (
+        team_df.drop_duplicates('team_name').set_index('team_name')['poss'].to_dict()
+    )
+    team_poss = df['team_full_name'].map(team_to_team_poss).astype(float).fillna(0.0)
     
+    matchup_col = f'implied_poss_{period}'
     if matchup_col in matchup_df.columns:
-        # Create a lookup for team -> implied_poss using full team name
         team_to_poss = matchup_df.set_index('team_name')[matchup_col].to_dict()
-        
-        df[f'implied_poss_{period}'] = df['team_full_name'].map(team_to_poss).fillna(0.0)
+        implied_poss = df['team_full_name'].map(team_to_poss).astype(float).fillna(0.0)
     else:
-        df[f'implied_poss_{period}'] = 0.0
-    
-    # Method 1: Implied Touches from Implied Possessions
-    # touches_ip = (poss_pct / 100) * tpp * implied_poss
-    df[f'touches_ip_{period}'] = (
-        (df[f'poss_pct_{period}'] / 100.0) * 
-        df[f'tpp_{period}'] * 
-        df[f'implied_poss_{period}']
-    )
+        implied_poss = np.zeros(len(df))
     
-    # Method 2: Implied Touches from Touches Per Minute
-    # touches_tpm = tpm * proj_mins
-    df[f'touches_tpm_{period}'] = (
-        df[f'tpm_{period}'] * 
-        df['proj_mins']
-    )
+    if team_fp is None:
+        team_fp = team_fp_totals(df, [period])[f'fp_{period}']
     
-    return df
+    names = (
+        'fppm', 'fppt', 'fppp', 'tpm', 'tpp', 'team_poss', 'poss_pct', 'implied_poss',
+        'touches_ip', 'touches_tpm', 'fp_proj_it', 'fp_proj_tpm', 'team_fp', 'fp_per',
+    )
+    arrays = _period_kernel(
+        *(
+            np.asarray(col, dtype=STAT_DTYPE)
+            for col in (
+                df[f'fp_{period}'],
+                df[f'min_{period}'],
+                df[f'touches_{period}'],
+                df[f'poss_{period}'],
+                df[f'gp_{period}'],
+                df['proj_mins'],
+                team_poss,
+                implied_poss,
+                team_fp,
+            )
+        )
+    )
+    return {f'{name}_{period}': arr for name, arr in zip(names, arrays)}
 
 
-def calculate_fantasy_projections(df: pd.DataFrame, period: str) -> pd.DataFrame:
-    """
-    Calculate fantasy point projections using both methods.
-    
-    Adds columns:
-    - fp_proj_it_{period}: Fantasy Points from Implied Touches method
-    - fp_proj_tpm_{period}: Fantasy Points from Touches Per Minute method
-    """
-    # Method 1: FP from Implied Touches
-    df[f'fp_proj_it_{period}'] = (
-        df[f'fppt_{period}'] * df[f'touches_ip_{period}']
+def team_fp_totals(df: pd.DataFrame, periods: List[str] = PERIODS) -> pd.DataFrame:
+    """Team total historical fp per player row, for every fp_{period} column in one groupby."""
+    return (
+        df.groupby('team', sort=False, observed=True)[[f'fp_{p}' for p in periods]]
+        .transform('sum')
+        .fillna(0.0)
     )
-    
-    # Method 2: FP from Touches Per Minute
-    df[f'fp_proj_tpm_{period}'] = (
-        df[f'fppt_{period}'] * df[f'touches_tpm_{period}']
-    )
-    
-    return df
 
 
-def calculate_team_fantasy_context(df: pd.DataFrame, period: str) -> pd.DataFrame:
+def _period_kernel(
+    fp: np.ndarray,
+    mins: np.ndarray,
+    touches: np.ndarray,
+    poss: np.ndarray,
+    gp: np.ndarray,
+    proj_mins: np.ndarray,
+    team_poss: np.ndarray,
+    implied_poss: np.ndarray,
+    team_fp: np.ndarray
+) -> tuple:
     """
-    Calculate team-level fantasy point aggregations.
+    Array math behind compute_period_block, on contiguous STAT_DTYPE arrays.
     
-    Adds columns:
-    - team_fp_{period}: Total team fantasy points
-    - fp_per_{period}: Player's fantasy point percentage of team
+    Derived arrays are updated in place where possible so each metric allocates
+    only its own output buffer.
     """
-    # Calculate team total fantasy points for historical period
-    df[f'team_fp_{period}'] = df.apply(
-        lambda row: DataUtils.sumif(
-            df['team'],
-            row['team'],
-            df[f'fp_{period}']
-        ),
-        axis=1
-    )
-    
-    # Calculate player's percentage of team fantasy points
-    df[f'fp_per_{period}'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row[f'fp_{period}'],
-            row[f'team_fp_{period}']
-        ) * 100.0,
-        axis=1
+    # Rate stats; possessions per game (1.0 when gp is zero) feeds fppp and tpp
+    poss_pg = DataUtils.safe_divide_array(poss, gp, 1.0)
+    fppm = DataUtils.safe_divide_array(fp, mins)
+    fppt = DataUtils.safe_divide_array(fp, touches)
+    fppp = DataUtils.safe_divide_array(fp, poss_pg)
+    tpm = DataUtils.safe_divide_array(touches, mins)
+    tpp = DataUtils.safe_divide_array(touches, poss_pg)
+    
+    # Team context: player's share of team possessions
+    poss_pct = DataUtils.safe_divide_array(poss, team_poss)
+    poss_pct *= 100.0
+    
+    # Touch projections: from implied possessions, and from touches per minute
+    touches_ip = poss_pct / 100.0
+    touches_ip *= tpp
+    touches_ip *= implied_poss
+    touches_tpm = tpm * proj_mins
+    
+    # Team fantasy context: player's share of team historical fp
+    fp_per = DataUtils.safe_divide_array(fp, team_fp)
+    fp_per *= 100.0
+    
+    return (
+        fppm, fppt, fppp, tpm, tpp, team_poss, poss_pct, implied_poss,
+        touches_ip, touches_tpm, fppt * touches_ip, fppt * touches_tpm, team_fp, fp_per,
     )
-    
-    return df
 
 
 def calculate_team_aggregates(df: pd.DataFrame) -> pd.DataFrame:
@@ -521,44 +529,27 @@ def calculate_team_aggregates(df: pd.DataFrame) -> pd.DataFrame:
     - team_minutes: Total projected minutes for team
     - minutes_avail: Available minutes (240 - team_minutes)
     """
-    # Team salary
-    df['team_salary'] = df.apply(
-        lambda row: DataUtils.sumif(
-            df['team'],
-            row['team'],
-            df['salary']
-        ),
-        axis=1
+    # Team salary, ownership and minutes summed per team in one groupby pass
+    team_totals = (
+        df.groupby('team', observed=True)[['salary', 'ownership', 'proj_mins']]
+        .transform('sum')
+        .fillna(0.0)
     )
     
+    # Team salary
+    df['team_salary'] = team_totals['salary']
+    
     # Salary share
-    df['salary_share'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row['salary'],
-            row['team_salary']
-        ) * 100.0,
-        axis=1
-    )
+    df['salary_share'] = DataUtils.safe_divide_array(
+        df['salary'].to_numpy(dtype=float),
+        df['team_salary'].to_numpy(dtype=float),
+    ) * 100.0
     
     # Team ownership
-    df['team_ownership'] = df.apply(
-        lambda row: DataUtils.sumif(
-            df['team'],
-            row['team'],
-            df['ownership']
-        ),
-        axis=1
-    )
+    df['team_ownership'] = team_totals['ownership']
     
     # Team minutes
-    df['team_minutes'] = df.apply(
-        lambda row: DataUtils.sumif(
-            df['team'],
-            row['team'],
-            df['proj_mins']
-        ),
-        axis=1
-    )
+    df['team_minutes'] = team_totals['proj_mins']
     
     # Available minutes (regulation game = 240 minutes total)
     df['minutes_avail'] = 240.0 - df['team_minutes']
@@ -589,20 +580,14 @@ def calculate_final_projection(df: pd.DataFrame) -> pd.DataFrame:
         proj_cols.append(f'fp_proj_tpm_{period}')
         weights.append(TPM_WEIGHTS[period])
     
-    # Calculate weighted average
-    total_weight = sum(weights)
-    
-    df['fp_proj'] = 0.0
-    for col, weight in zip(proj_cols, weights):
-        df['fp_proj'] += (df[col] * weight) / total_weight
+    # Calculate weighted average as one matrix-vector product
+    weight_vec = np.asarray(weights, dtype=float) / sum(weights)
+    df['fp_proj'] = df[proj_cols].to_numpy(dtype=float) @ weight_vec
     
     # Calculate value (points per $1000)
-    df['projected_value'] = df.apply(
-        lambda row: DataUtils.safe_divide(
-            row['fp_proj'],
-            row['salary'] / 1000.0
-        ),
-        axis=1
+    df['projected_value'] = DataUtils.safe_divide_array(
+        df['fp_proj'].to_numpy(dtype=float),
+        df['salary'].to_numpy(dtype=float) / 1000.0,
     )
     
     return df
@@ -663,24 +648,19 @@ def build_projections(
     print("Handling missing data...")
     df = handle_missing_data(df)
     
-    # Calculate metrics for each period
-    for period in PERIODS:
-        print(f"Calculating metrics for {period}...")
-        
-        # Rate stats
-        df = calculate_rate_stats(df, period)
-        
-        # Team context
-        df = calculate_team_context(df, team_dfs, period)
-        
-        # Touch projections
-        df = calculate_touch_projections(df, matchup_df, period)
-        
-        # Fantasy projections
-        df = calculate_fantasy_projections(df, period)
-        
-        # Team fantasy context
-        df = calculate_team_fantasy_context(df, period)
+    # Calculate metrics for each period. Periods only read df and produce disjoint
+    # columns, so they run on a thread pool (numpy releases the GIL) and are
+    # attached together in PERIODS order.
+    print(f"Calculating metrics for {', '.join(PERIODS)}...")
+    team_fp = team_fp_totals(df)
+    with ThreadPoolExecutor(max_workers=len(PERIODS)) as pool:
+        blocks = list(pool.map(
+            lambda period: compute_period_block(
+                df, period, team_dfs[period], matchup_df, team_fp[f'fp_{period}']
+            ),
+            PERIODS,
+        ))
+    df = pd.concat([df] + [pd.DataFrame(block, index=df.index) for block in blocks], axis=1)
     
     # Calculate team aggregates
     print("Calculating team aggregates...")
@@ -708,11 +688,9 @@ def build_projections(
 
 def save_projections(df: pd.DataFrame, output_path: Path) -> None:
     """Save projections to CSV file."""
-    # Save all columns for inspection
-    output_df = df.copy()
-    
-    # Sort by projected fantasy points descending
-    output_df = output_df.sort_values('fp_proj', ascending=False)
+    # Sort by projected fantasy points descending (sort_values already returns
+    # a new frame, so df itself is left untouched)
+    output_df = df.sort_values('fp_proj', ascending=False)
     
     # Reorder columns to put key columns first
     key_cols = ['game_date', 'player', 'pos', 'team', 'opp', 'salary', 'proj_mins', 
@@ -1,6 +1,10 @@
 """
 Examples demonstrating usage of utility functions.
 This is not meant to be run, just for reference.
+
+The scalar helpers (xlookup, sumif, safe_divide) are for single values; for whole
+columns prefer the vectorized forms shown below: a left merge for lookups, a
+groupby transform for per-group sums and DataUtils.safe_divide_array for division.
 """
 import pandas as pd
 from analysis.utils import DataUtils, NameMatcher
@@ -47,19 +51,13 @@ def example_data_utils():
     value = DataUtils.coalesce(None, None, 42, 100)
     print(f"First non-None: {value}")  # 42
     
-    # Example 6: Using with DataFrame apply
-    df['points_per_minute'] = df.apply(
-        lambda row: DataUtils.safe_divide(row['points'], row['minutes']),
-        axis=1
-    )
+    # Example 6: Whole-column safe divide (prefer this over df.apply per row)
+    df['points_per_minute'] = DataUtils.safe_divide_array(df['points'], df['minutes'])
     print("\nPoints per minute for all players:")
     print(df[['player', 'points_per_minute']])
     
-    # Example 7: Team salary totals using SUMIF
-    df['team_salary'] = df.apply(
-        lambda row: DataUtils.sumif(df['team'], row['team'], df['salary']),
-        axis=1
-    )
+    # Example 7: Team salary totals - SUMIF for every row is one groupby transform
+    df['team_salary'] = df.groupby('team')['salary'].transform('sum')
     print("\nTeam salary totals:")
     print(df[['player', 'team', 'salary', 'team_salary']])
 
@@ -158,32 +156,27 @@ def example_projection_workflow():
     print("1. Name mapping:")
     print(daily_df[['player', 'db_player']])
     
-    # Step 2: Lookup historical stats
-    daily_df['hist_fp'] = daily_df['db_player'].apply(
-        lambda x: DataUtils.xlookup(x, historical_df['player'], historical_df['fp'], 0.0)
-    )
-    
-    daily_df['hist_touches'] = daily_df['db_player'].apply(
-        lambda x: DataUtils.xlookup(x, historical_df['player'], historical_df['touches'], 0.0)
-    )
-    
-    daily_df['hist_minutes'] = daily_df['db_player'].apply(
-        lambda x: DataUtils.xlookup(x, historical_df['player'], historical_df['minutes'], 1.0)
+    # Step 2: Lookup historical stats - XLOOKUP for every row is one left merge
+    # (first match per player, like xlookup), with if_not_found as fillna
+    hist = (
+        historical_df[['player', 'fp', 'touches', 'minutes']]
+        .drop_duplicates('player')
+        .rename(columns={
+            'player': 'db_player',
+            'fp': 'hist_fp',
+            'touches': 'hist_touches',
+            'minutes': 'hist_minutes',
+        })
     )
+    daily_df = daily_df.merge(hist, on='db_player', how='left')
+    daily_df = daily_df.fillna({'hist_fp': 0.0, 'hist_touches': 0.0, 'hist_minutes': 1.0})
     
     print("\n2. Historical stats merged:")
     print(daily_df[['player', 'hist_fp', 'hist_touches', 'hist_minutes']])
     
     # Step 3: Calculate rate stats
-    daily_df['fppm'] = daily_df.apply(
-        lambda row: DataUtils.safe_divide(row['hist_fp'], row['hist_minutes']),
-        axis=1
-    )
-    
-    daily_df['tpm'] = daily_df.apply(
-        lambda row: DataUtils.safe_divide(row['hist_touches'], row['hist_minutes']),
-        axis=1
-    )
+    daily_df['fppm'] = DataUtils.safe_divide_array(daily_df['hist_fp'], daily_df['hist_minutes'])
+    daily_df['tpm'] = DataUtils.safe_divide_array(daily_df['hist_touches'], daily_df['hist_minutes'])
     
     print("\n3. Rate stats calculated:")
     print(daily_df[['player', 'fppm', 'tpm']])
@@ -196,19 +189,13 @@ def example_projection_workflow():
     print(daily_df[['player', 'proj_mins', 'proj_touches', 'proj_fp']])
     
     # Step 5: Calculate value (points per $1k)
-    daily_df['value'] = daily_df.apply(
-        lambda row: DataUtils.safe_divide(row['proj_fp'], row['salary'] / 1000),
-        axis=1
-    )
+    daily_df['value'] = DataUtils.safe_divide_array(daily_df['proj_fp'], daily_df['salary'] / 1000)
     
     print("\n5. Value calculation:")
     print(daily_df[['player', 'salary', 'proj_fp', 'value']])
     
     # Step 6: Team aggregations
-    daily_df['team_salary'] = daily_df.apply(
-        lambda row: DataUtils.sumif(daily_df['team'], row['team'], daily_df['salary']),
-        axis=1
-    )
+    daily_df['team_salary'] = daily_df.groupby('team')['salary'].transform('sum')
     
     print("\n6. Team aggregations:")
     print(daily_df[['player', 'team', 'salary', 'team_salary']])
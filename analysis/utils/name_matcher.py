@@ -1,14 +1,31 @@
 """
 Player name matching utilities using fuzzy matching and common name variations.
 """
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, NamedTuple, Tuple
 from difflib import SequenceMatcher
+from functools import lru_cache, partial
 import re
 
 
+def _alternation(words) -> str:
+    """Regex alternation of literal words, longest first so longer variations win."""
+    return '|'.join(re.escape(w) for w in sorted(words, key=lambda w: (-len(w), w)))
+
+
+class _PreparedTargets(NamedTuple):
+    """Target names normalized once for repeated best-match scans."""
+    by_length: Dict[int, List[Tuple[int, str, str, str, SequenceMatcher]]]
+    exact: Dict[str, str]
+    stripped: Dict[str, Tuple[int, str]]
+
+
 class NameMatcher:
     """Handles player name matching between different data sources."""
     
+    # Bump whenever normalize_name / strip_suffix / scoring change what a name
+    # resolves to; persisted name maps are keyed on it
+    VERSION = 1
+    
     # Common suffixes and their variations
     SUFFIX_VARIATIONS = {
         'jr.': ['jr', 'jr.', 'junior'],
@@ -19,7 +36,27 @@ class NameMatcher:
         'v': ['v', '5', 'the fifth'],
     }
     
+    # Punctuation handling, applied in one translate pass
+    _PUNCT_TABLE = str.maketrans({".": None, "'": None, "-": " "})
+    
+    # Every suffix variation -> canonical form (without dots), matched by one
+    # precompiled alternation (longest first so multi-word variations win)
+    _SUFFIX_MAP = {
+        var: standard.replace('.', '')
+        for standard, variations in SUFFIX_VARIATIONS.items()
+        for var in variations
+    }
+    _SUFFIX_RE = re.compile(r'\b(' + _alternation(_SUFFIX_MAP) + r')\b')
+    # Bound substitution (pattern + replacement built once, not per call)
+    _SUFFIX_SUB = partial(_SUFFIX_RE.sub, lambda m, _map=_SUFFIX_MAP: _map[m.group(1)])
+    
+    # Any suffix, canonical or variation, for strip_suffix
+    _STRIP_RE = re.compile(
+        r'\b(?:' + _alternation({*_SUFFIX_MAP, *_SUFFIX_MAP.values()}) + r')\b'
+    )
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_name(name: str) -> str:
         """
         Normalize a player name for comparison.
@@ -33,24 +70,20 @@ class NameMatcher:
         if not name:
             return ""
         
-        # Convert to lowercase and strip
-        name = name.lower().strip()
-        
-        # Remove multiple spaces
-        name = " ".join(name.split())
+        # Convert to lowercase, trim and collapse whitespace (split() with no
+        # arguments already ignores leading/trailing whitespace)
+        name = " ".join(name.lower().split())
         
         # Remove common punctuation
-        name = name.replace(".", "").replace("'", "").replace("-", " ")
+        name = name.translate(NameMatcher._PUNCT_TABLE)
         
         # Normalize suffixes
-        for standard, variations in NameMatcher.SUFFIX_VARIATIONS.items():
-            for var in variations:
-                pattern = r'\b' + re.escape(var) + r'\b'
-                name = re.sub(pattern, standard.replace('.', ''), name)
+        name = NameMatcher._SUFFIX_SUB(name)
         
         return name
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def strip_suffix(name: str) -> str:
         """
         Remove common suffixes from name.
@@ -61,47 +94,58 @@ class NameMatcher:
         Returns:
             Name without suffix
         """
-        normalized = NameMatcher.normalize_name(name)
-        
-        # Remove known suffixes
-        for standard, variations in NameMatcher.SUFFIX_VARIATIONS.items():
-            for var in [standard.replace('.', '')] + variations:
-                pattern = r'\b' + re.escape(var) + r'\b'
-                normalized = re.sub(pattern, '', normalized)
-        
-        return " ".join(normalized.split()).strip()
+        return NameMatcher._strip_normalized(NameMatcher.normalize_name(name))
+    
+    @staticmethod
+    def _strip_normalized(normalized: str) -> str:
+        """strip_suffix for a name that is already normalized."""
+        # Remove known suffixes in one scan, then re-collapse the whitespace they leave
+        return " ".join(NameMatcher._STRIP_RE.sub('', normalized).split())
     
     @staticmethod
-    def similarity_score(name1: str, name2: str) -> float:
+    def similarity_score(name1: str, name2: str, score_cutoff: float = 0.0) -> float:
         """
         Calculate similarity score between two names (0.0 to 1.0).
         
         Args:
             name1: First name
             name2: Second name
+            score_cutoff: Scores below this are reported as 0.0, which lets
+                clearly dissimilar pairs skip the fuzzy ratio (default: 0.0)
             
         Returns:
             Similarity score between 0 and 1
         """
-        norm1 = NameMatcher.normalize_name(name1)
-        norm2 = NameMatcher.normalize_name(name2)
-        
+        return NameMatcher._sim_norm(
+            NameMatcher.normalize_name(name1), NameMatcher.normalize_name(name2), score_cutoff
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _sim_norm(norm1: str, norm2: str, score_cutoff: float = 0.0) -> float:
+        """similarity_score for two names that are already normalized."""
         if not norm1 or not norm2:
             return 0.0
         
         # Try exact match first
         if norm1 == norm2:
-            return 1.0
+            return 1.0 if score_cutoff <= 1.0 else 0.0
         
         # Try without suffixes
-        stripped1 = NameMatcher.strip_suffix(name1)
-        stripped2 = NameMatcher.strip_suffix(name2)
+        stripped1 = NameMatcher._strip_normalized(norm1)
+        stripped2 = NameMatcher._strip_normalized(norm2)
         
         if stripped1 == stripped2 and stripped1:
-            return 0.95
+            return 0.95 if score_cutoff <= 0.95 else 0.0
+        
+        # The ratio can never exceed 2 * shorter / total length
+        len1, len2 = len(norm1), len(norm2)
+        if 2.0 * min(len1, len2) / (len1 + len2) < score_cutoff:
+            return 0.0
         
         # Use sequence matcher for fuzzy matching
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        score = SequenceMatcher(None, norm1, norm2).ratio()
+        return score if score >= score_cutoff else 0.0
     
     @staticmethod
     def find_best_match(
@@ -123,19 +167,11 @@ class NameMatcher:
         if not target_name or not candidate_names:
             return None
         
-        best_match = None
-        best_score = 0.0
-        
-        for candidate in candidate_names:
-            score = NameMatcher.similarity_score(target_name, candidate)
-            if score > best_score:
-                best_score = score
-                best_match = candidate
-        
-        if best_score >= threshold:
-            return (best_match, best_score)
-        
-        return None
+        # Same scores as similarity_score over every candidate, but one scan with
+        # per-candidate matchers and upper-bound pruning
+        return NameMatcher._best_prepared_match(
+            target_name, NameMatcher._prepare_targets(candidate_names), threshold
+        )
     
     @staticmethod
     def build_name_map(
@@ -154,12 +190,152 @@ class NameMatcher:
         Returns:
             Dictionary mapping source names to target names
         """
-        name_map = {}
+        if not target_names:
+            return {}
+        
+        targets = NameMatcher._prepare_targets(target_names)
         
-        for source_name in source_names:
-            match = NameMatcher.find_best_match(source_name, target_names, threshold)
-            if match:
-                name_map[source_name] = match[0]
+        # Each distinct source is scored once. Most sources are exact matches after
+        # normalization and resolve with a dict lookup; only the rest go fuzzy.
+        sources = list(dict.fromkeys(source_names))
+        matched = {}
+        fuzzy = []
+        for source_name in sources:
+            exact = targets.exact.get(NameMatcher.normalize_name(source_name)) if source_name else None
+            if exact is not None and threshold <= 1.0:
+                matched[source_name] = exact
+            else:
+                fuzzy.append(source_name)
         
-        return name_map
+        matched.update(_match_prepared(fuzzy, targets, threshold))
+        
+        # Source order, as a single serial pass would produce
+        return {name: matched[name] for name in sources if name in matched}
+    
+    @staticmethod
+    def _prepare_targets(target_names: List[str]) -> _PreparedTargets:
+        """
+        Normalize every target once and keep one SequenceMatcher per target with it
+        as seq2 (difflib indexes seq2), so each pair only pays for the ratio itself.
+        
+        Targets are grouped by normalized length (original order kept within a
+        group) and carry their original index for tie-breaking. The first target
+        for each normalized / suffix-stripped name is indexed for O(1) exact
+        lookups. Targets that normalize to "" can never score above 0 and are skipped.
+        """
+        by_length = {}
+        exact = {}
+        stripped_index = {}
+        for index, target_name in enumerate(target_names):
+            norm = NameMatcher.normalize_name(target_name)
+            if norm:
+                stripped = NameMatcher._strip_normalized(norm)
+                by_length.setdefault(len(norm), []).append((
+                    index,
+                    target_name,
+                    norm,
+                    stripped,
+                    SequenceMatcher(None, "", norm),
+                ))
+                exact.setdefault(norm, target_name)
+                if stripped:
+                    stripped_index.setdefault(stripped, (index, target_name))
+        return _PreparedTargets(by_length, exact, stripped_index)
+    
+    @staticmethod
+    def _best_prepared_match(
+        source_name: str,
+        targets: _PreparedTargets,
+        threshold: float
+    ) -> Optional[Tuple[str, float]]:
+        """
+        find_best_match against targets prepared by _prepare_targets.
+        
+        Scores are identical to similarity_score. Exact and suffix-stripped matches
+        are dict lookups; only then are candidates fuzzy-scanned, closest in length
+        first so a good match raises the bar early. Ties go to the earliest
+        candidate, as in a plain scan. Candidates whose length-based or
+        character-count upper bound cannot beat both the threshold and the current
+        best are skipped without running the full ratio.
+        """
+        if not source_name:
+            return None
+        
+        norm = NameMatcher.normalize_name(source_name)
+        if not norm:
+            return (None, 0.0) if threshold <= 0.0 else None
+        
+        # Exact match after normalization
+        exact = targets.exact.get(norm)
+        if exact is not None:
+            return (exact, 1.0) if threshold <= 1.0 else None
+        
+        # Match without suffixes; fuzzy candidates still have to beat it
+        stripped = NameMatcher._strip_normalized(norm)
+        best_match = None
+        best_score = 0.0
+        best_index = -1
+        if stripped and stripped in targets.stripped:
+            best_index, best_match = targets.stripped[stripped]
+            best_score = 0.95
+        
+        norm_len = len(norm)
+        for cand_len in sorted(targets.by_length, key=lambda n: (abs(n - norm_len), n)):
+            length_bound = 2.0 * min(norm_len, cand_len) / (norm_len + cand_len)
+            if length_bound < threshold or length_bound < best_score:
+                continue
+            for index, candidate, cand_norm, cand_stripped, matcher in targets.by_length[cand_len]:
+                # Suffix-stripped equals were covered by the lookup above
+                if stripped and cand_stripped == stripped:
+                    continue
+                # Indexes rise within a group, so once the shared length bound
+                # cannot beat the best the rest of the group cannot either
+                if length_bound < best_score or (
+                    length_bound == best_score and best_match is not None and index > best_index
+                ):
+                    break
+                matcher.set_seq1(norm)
+                if not NameMatcher._may_win(
+                    matcher.quick_ratio(), index, threshold,
+                    best_match, best_score, best_index
+                ):
+                    continue
+                score = matcher.ratio()
+                
+                if score > best_score or (
+                    score == best_score and best_match is not None and index < best_index
+                ):
+                    best_score = score
+                    best_match = candidate
+                    best_index = index
+        
+        if best_score >= threshold:
+            return (best_match, best_score)
+        
+        return None
+    
+    @staticmethod
+    def _may_win(
+        bound: float,
+        index: int,
+        threshold: float,
+        best_match: Optional[str],
+        best_score: float,
+        best_index: int
+    ) -> bool:
+        """Whether a candidate scoring at most bound could still replace the current best."""
+        if bound < threshold or bound < best_score:
+            return False
+        if bound == best_score:
+            return best_match is not None and index < best_index
+        return True
+
 
+def _match_prepared(source_names: List[str], targets: _PreparedTargets, threshold: float) -> Dict[str, str]:
+    """Best match for each source against prepared targets, keeping only hits."""
+    name_map = {}
+    for source_name in source_names:
+        match = NameMatcher._best_prepared_match(source_name, targets, threshold)
+        if match:
+            name_map[source_name] = match[0]
+    return name_map
@@ -10,11 +10,23 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from sqlalchemy import text
+
 from db.database import get_engine, get_session_maker
-from db.db_extract import load_player_stats_dataframe, load_team_stats_dataframe
+from db.db_extract.extractors import PLAYER_STATS_COLUMNS
 from analysis.utils import DataUtils, NameMatcher
 
 
+def _row_counts(session, table_prefix, periods):
+    """COUNT(*) of {table_prefix}_{period} for every period, in one round-trip."""
+    query = "\nUNION ALL\n".join(
+        f"SELECT '{period}' AS period, COUNT(*) AS n FROM {table_prefix}_{period}"
+        for period in periods
+    )
+    rows = session.execute(text(query)).all()
+    return {period: n for period, n in rows}
+
+
 def check_database():
     """Check if database has required data."""
     print("=" * 60)
@@ -25,18 +37,32 @@ def check_database():
         engine = get_engine()
         SessionLocal = get_session_maker(engine)
         
+        periods = ['season_long', 'last_10', 'last_5', 'last_3']
+        
         with SessionLocal() as session:
-            # Check player stats
-            for period in ['season_long', 'last_10', 'last_5', 'last_3']:
-                df = load_player_stats_dataframe(session, period)
-                print(f"✓ Player stats ({period:12s}): {len(df):4d} players")
+            # Check player stats (row counts for all periods in one query)
+            counts = _row_counts(session, 'player_data.player_stats', periods)
+            for period in periods:
+                print(f"✓ Player stats ({period:12s}): {counts[period]:4d} players")
+            
+            # Confirm the columns the projections read exist; LIMIT 0 returns
+            # just the result schema, no rows
+            import pandas as pd
+            df = pd.read_sql_query(
+                text(
+                    f"SELECT {', '.join(PLAYER_STATS_COLUMNS)} "
+                    "FROM player_data.player_stats_season_long LIMIT 0"
+                ),
+                session.connection(),
+            )
+            print(f"✓ Player stats columns: {len(df.columns)} present")
             
             print()
             
-            # Check team stats
-            for period in ['season_long', 'last_10', 'last_5', 'last_3']:
-                df = load_team_stats_dataframe(session, period)
-                print(f"✓ Team stats  ({period:12s}): {len(df):4d} teams")
+            # Check team stats (row counts for all periods in one query)
+            counts = _row_counts(session, 'team_data.team_stats', periods)
+            for period in periods:
+                print(f"✓ Team stats  ({period:12s}): {counts[period]:4d} teams")
             
         print("\n✅ Database connection successful!")
         return True
@@ -7,15 +7,6 @@ try:
     from .database import Base, get_engine
     # Import models so their metadata is registered with Base
     from . import models  # noqa: F401
-    from .models import (
-        TeamStats,
-        PlayerStatsSeasonLong,
-        PlayerStatsLast10,
-        PlayerStatsLast5,
-        PlayerStatsLast3,
-        GameMatchup,
-        PlayerProjection,
-    )  # explicit for targeted create if needed
 except ImportError:
     import sys
     from pathlib import Path
@@ -26,36 +17,24 @@ except ImportError:
         sys.path.insert(0, str(ROOT))
     from db.database import Base, get_engine  # type: ignore
     from db import models  # type: ignore  # noqa: F401
-    from db.models import (  # type: ignore
-        TeamStats,
-        PlayerStatsSeasonLong,
-        PlayerStatsLast10,
-        PlayerStatsLast5,
-        PlayerStatsLast3,
-        GameMatchup,
-        PlayerProjection,
-    )
 
 
 def create_all(database_url: Optional[str] = None) -> None:
     engine = get_engine(database_url)
-    # Ensure the 'team_data' schema exists for models that target it (e.g., TeamStats)
     with engine.begin() as conn:
-        conn.execute(text("CREATE SCHEMA IF NOT EXISTS team_data"))
-        conn.execute(text("CREATE SCHEMA IF NOT EXISTS player_data"))
-        conn.execute(text("CREATE SCHEMA IF NOT EXISTS analysis"))
-    # Create all tables registered on Base
-    Base.metadata.create_all(bind=engine)
-    # Ensure TeamStats specifically exists in case metadata discovery was incomplete
-    TeamStats.__table__.create(bind=engine, checkfirst=True)
-    # Ensure PlayerStats tables exist across timeframes
-    PlayerStatsSeasonLong.__table__.create(bind=engine, checkfirst=True)
-    PlayerStatsLast10.__table__.create(bind=engine, checkfirst=True)
-    PlayerStatsLast5.__table__.create(bind=engine, checkfirst=True)
-    PlayerStatsLast3.__table__.create(bind=engine, checkfirst=True)
-    # Ensure analysis tables exist
-    GameMatchup.__table__.create(bind=engine, checkfirst=True)
-    PlayerProjection.__table__.create(bind=engine, checkfirst=True)
+        # Ensure the schemas the models target exist, in one round-trip (no bind
+        # parameters, so the driver sends all three statements as one query)
+        conn.execute(
+            text(
+                "CREATE SCHEMA IF NOT EXISTS team_data; "
+                "CREATE SCHEMA IF NOT EXISTS player_data; "
+                "CREATE SCHEMA IF NOT EXISTS analysis"
+            )
+        )
+        # Create all tables registered on Base (every model is registered by the
+        # models import above; create_all already skips tables that exist) on the
+        # same connection and transaction
+        Base.metadata.create_all(bind=conn)
 
 
 def main() -> None:
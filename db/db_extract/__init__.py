@@ -1,20 +1,30 @@
 from .extractors import (
     fetch_schedule_for_date,
+    fetch_schedule_for_dates,
+    fetch_matchup_inputs,
     load_team_stats_map,
     compute_league_baselines,
     resolve_team_record,
+    build_nickname_index,
     load_player_stats_dataframe,
+    load_player_stats_dataframes_bulk,
     load_team_stats_dataframe,
+    load_team_stats_dataframes_bulk,
     load_game_matchup_dataframe,
 )
 
 __all__ = [
     "fetch_schedule_for_date",
+    "fetch_schedule_for_dates",
+    "fetch_matchup_inputs",
     "load_team_stats_map",
     "compute_league_baselines",
     "resolve_team_record",
+    "build_nickname_index",
     "load_player_stats_dataframe",
+    "load_player_stats_dataframes_bulk",
     "load_team_stats_dataframe",
+    "load_team_stats_dataframes_bulk",
     "load_game_matchup_dataframe",
 ]
 
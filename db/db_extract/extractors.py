@@ -1,12 +1,46 @@
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 import pandas as pd
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+
+# Columns returned by load_player_stats_dataframe / load_team_stats_dataframe, in order
+PLAYER_STATS_COLUMNS = (
+    "player_id", "player", "team", "age", "gp", "w", "l", "min", "pts", "fgm", "fga",
+    "fg_pct", "three_pm", "three_pa", "three_p_pct", "ftm", "fta", "ft_pct", "oreb",
+    "dreb", "reb", "ast", "tov", "stl", "blk", "pf", "fp", "dd2", "tdthree_",
+    "plus_minus", "offrtg", "defrtg", "netrtg", "ast_pct", "ast_to", "ast_ratio",
+    "oreb_pct", "dreb_pct", "reb_pct", "tov_pct", "efg_pct", "ts_pct", "usg_pct",
+    "pace", "pie", "poss", "touches", "front_ct_touches", "time_of_poss",
+    "avg_sec_per_touch", "avg_drib_per_touch", "pts_per_touch", "elbow_touches",
+    "post_ups", "paint_touches", "pts_per_elbow_touch", "pts_per_post_touch",
+    "pts_per_paint_touch",
+)
+
+TEAM_STATS_COLUMNS = (
+    "team_id", "team_name", "gp", "w", "l", "min", "pts", "fgm", "fga", "fg_pct",
+    "three_pm", "three_pa", "three_p_pct", "ftm", "fta", "ft_pct", "oreb", "dreb",
+    "reb", "ast", "tov", "stl", "blk", "pf", "plus_minus", "offrtg", "defrtg",
+    "netrtg", "ast_pct", "ast_to", "ast_ratio", "oreb_pct", "dreb_pct", "reb_pct",
+    "tov_pct", "efg_pct", "ts_pct", "pace", "pie", "poss",
+)
 
 
 def _norm_name(name: str) -> str:
-    return " ".join((name or "").strip().split()).lower()
+    # None / "" short-circuit so only real names reach the cache
+    if not name:
+        return ""
+    return _norm_name_cached(name)
+
+
+@lru_cache(maxsize=1024)
+def _norm_name_cached(name: str) -> str:
+    # split() already drops surrounding whitespace; lower once, join once
+    return " ".join(name.lower().split())
 
 
 def fetch_schedule_for_date(session: Session, game_date_est) -> List[dict]:
@@ -27,6 +61,41 @@ def fetch_schedule_for_date(session: Session, game_date_est) -> List[dict]:
     return [dict(r) for r in rows]
 
 
+def fetch_schedule_for_dates(session: Session, dates: Iterable) -> Dict[object, List[dict]]:
+    """
+    Schedules for several dates in one round-trip.
+    Returns {date: list as fetch_schedule_for_date}; dates without games map to [].
+    """
+    dates = list(dict.fromkeys(dates))
+    if not dates:
+        return {}
+    rows = session.execute(
+        text(
+            """
+            select game_date_est, home_team, away_team
+            from game_schedule
+            where game_date_est = any(:dates)
+            order by game_date_est, home_team, away_team
+            """
+        ),
+        {"dates": dates},
+    ).mappings().all()
+    out: Dict[object, List[dict]] = {d: [] for d in dates}
+    for game_date, games in groupby(rows, key=lambda r: r["game_date_est"]):
+        out.setdefault(game_date, []).extend(dict(r) for r in games)
+    return out
+
+
+def _team_stats_record(r) -> dict:
+    return {
+        "team_id": r["team_id"],
+        "team_name": r["team_name"],
+        "pace": r["pace"],
+        "offrtg": r["offrtg"],
+        "defrtg": r["defrtg"],
+    }
+
+
 def load_team_stats_map(session: Session, timeframe: str) -> Dict[str, dict]:
     """
     Load team stats for a timeframe (season_long, last_10, last_5, last_3)
@@ -45,13 +114,7 @@ def load_team_stats_map(session: Session, timeframe: str) -> Dict[str, dict]:
     out: Dict[str, dict] = {}
     for r in rows:
         key = _norm_name(r["team_name"])
-        out[key] = {
-            "team_id": r["team_id"],
-            "team_name": r["team_name"],
-            "pace": r["pace"],
-            "offrtg": r["offrtg"],
-            "defrtg": r["defrtg"],
-        }
+        out[key] = _team_stats_record(r)
     return out
 
 
@@ -72,6 +135,80 @@ def compute_league_baselines(session: Session, timeframe: str) -> Tuple[float, f
     return float(row["lg_pace"] or 0.0), float(row["lg_pp100"] or 0.0)
 
 
+def fetch_matchup_inputs(
+    session: Session, game_date_est, timeframes: Iterable[str]
+) -> Tuple[List[dict], Dict[str, Dict[str, dict]], Dict[str, Tuple[float, float]]]:
+    """
+    Fetch everything game_matchup needs for a date in a single round-trip:
+    the schedule, per-timeframe team stats maps and per-timeframe league baselines.
+
+    Returns (schedule, stats_maps, baselines): the schedule as fetch_schedule_for_date,
+    {timeframe: load_team_stats_map} and {timeframe: compute_league_baselines}.
+    """
+    timeframes = list(timeframes)
+    parts = [
+        """
+            select 'schedule' as kind, null as timeframe,
+                   row_number() over (order by home_team, away_team) as ord,
+                   game_date_est, home_team, away_team,
+                   null as team_id, null as team_name,
+                   null as pace, null as offrtg, null as defrtg
+            from sched
+        """
+    ]
+    for tf in timeframes:
+        table = f"team_data.team_stats_{tf}"
+        parts.append(
+            f"""
+            select 'stats', '{tf}', null, null, null, null,
+                   team_id, team_name, pace, offrtg, defrtg
+            from {table}
+            """
+        )
+        parts.append(
+            f"""
+            select 'baseline', '{tf}', null, null, null, null,
+                   null, null, avg(pace), avg(offrtg), null
+            from {table}
+            """
+        )
+    query = (
+        """
+            with sched as (
+                select game_date_est, home_team, away_team
+                from game_schedule
+                where game_date_est = :d
+            )
+        """
+        + "\nunion all\n".join(parts)
+    )
+    rows = session.execute(text(query), {"d": game_date_est}).mappings().all()
+
+    schedule: List[Tuple[int, dict]] = []
+    stats_maps: Dict[str, Dict[str, dict]] = {tf: {} for tf in timeframes}
+    baselines: Dict[str, Tuple[float, float]] = {}
+    for r in rows:
+        kind = r["kind"]
+        if kind == "schedule":
+            schedule.append(
+                (
+                    r["ord"],
+                    {
+                        "game_date_est": r["game_date_est"],
+                        "home_team": r["home_team"],
+                        "away_team": r["away_team"],
+                    },
+                )
+            )
+        elif kind == "stats":
+            stats_maps[r["timeframe"]][_norm_name(r["team_name"])] = _team_stats_record(r)
+        else:
+            # Baseline rows reuse the pace/offrtg columns for avg(pace)/avg(offrtg)
+            baselines[r["timeframe"]] = (float(r["pace"] or 0.0), float(r["offrtg"] or 0.0))
+    schedule.sort(key=lambda item: item[0])
+    return [g for _, g in schedule], stats_maps, baselines
+
+
 # --- Team alias resolution helpers ---
 
 # Map normalized schedule keys to a set of variant normalized keys we should try
@@ -124,48 +261,110 @@ _ALIAS_VARIANTS: Dict[str, List[str]] = {
 }
 
 
-def _candidate_keys_for(name_norm: str) -> List[str]:
-    # return variants we should test for this name
-    if name_norm in _ALIAS_VARIANTS:
-        return list(dict.fromkeys([_norm_name(v) for v in _ALIAS_VARIANTS[name_norm]]))
+# Normalized, de-duplicated lookup keys per alias entry, built once at import
+_ALIAS_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+    canon: tuple(dict.fromkeys(_norm_name(v) for v in variants))
+    for canon, variants in _ALIAS_VARIANTS.items()
+}
+
+# Word-level trie over every normalized alias key and variant, mapping to the alias
+# entry it belongs to; lets decorated names ("la clippers (h)") resolve by their
+# longest alias prefix in one left-to-right scan
+_ALIAS_TRIE: Dict[Optional[str], Any] = {}
+for _canon, _variants in _ALIAS_CANDIDATES.items():
+    for _key in (_canon,) + _variants:
+        _node = _ALIAS_TRIE
+        for _token in _key.split():
+            _node = _node.setdefault(_token, {})
+        _node.setdefault(None, _canon)
+del _canon, _variants, _key, _node, _token
+
+
+def _longest_alias_prefix(name_norm: str) -> Optional[str]:
+    # alias entry of the longest alias variant that name_norm starts with (whole words)
+    node = _ALIAS_TRIE
+    found = None
+    for token in name_norm.split():
+        node = node.get(token)
+        if node is None:
+            break
+        found = node.get(None, found)
+    return found
+
+
+# Generic city-phrase substitutions for names without an alias entry
+_PHRASE_VARIANTS: Dict[str, List[str]] = {
+    "los angeles": ["la", "los angeles"],
+    "new york": ["ny", "new york"],
+    "san antonio": ["sa", "san antonio"],
+    "golden state": ["gs", "golden st", "golden state"],
+    "new orleans": ["no", "nola", "new orleans"],
+    "oklahoma city": ["okc", "oklahoma city"],
+}
+
+
+@lru_cache(maxsize=256)
+def _candidate_keys_for(name_norm: str) -> Tuple[str, ...]:
+    # return keys we should test for this name, name_norm itself first (memoized:
+    # the same ~30 team names are resolved for every date and timeframe)
+    if name_norm in _ALIAS_CANDIDATES:
+        return tuple(dict.fromkeys((name_norm,) + _ALIAS_CANDIDATES[name_norm]))
     # generic substitutions
-    tokens = name_norm.split()
     out: List[str] = [name_norm]
-    sub_map = {
-        "los angeles": ["la", "los angeles"],
-        "new york": ["ny", "new york"],
-        "san antonio": ["sa", "san antonio"],
-        "golden state": ["gs", "golden st", "golden state"],
-        "new orleans": ["no", "nola", "new orleans"],
-        "oklahoma city": ["okc", "oklahoma city"],
-    }
-    for phrase, variants in sub_map.items():
+    for phrase, variants in _PHRASE_VARIANTS.items():
         if phrase in name_norm:
             for v in variants:
                 out.append(name_norm.replace(phrase, v))
     # de-dup and normalize
-    return list(dict.fromkeys([_norm_name(v) for v in out]))
+    return tuple(dict.fromkeys(_norm_name(v) for v in out))
 
 
-def resolve_team_record(stats_map: Dict[str, dict], schedule_name: str) -> Tuple[Optional[dict], Optional[str]]:
+def build_nickname_index(stats_map: Dict[str, dict]) -> Dict[str, List[str]]:
+    """
+    Map every name token to the stats_map keys containing it, tokenizing each key
+    once. Pass to resolve_team_record when resolving many names against one map.
+    """
+    index: Dict[str, List[str]] = {}
+    for key in stats_map:
+        for token in dict.fromkeys(key.split()):
+            index.setdefault(token, []).append(key)
+    return index
+
+
+def resolve_team_record(
+    stats_map: Dict[str, dict],
+    schedule_name: str,
+    nickname_index: Optional[Dict[str, List[str]]] = None,
+) -> Tuple[Optional[dict], Optional[str]]:
     """
     Try to resolve a schedule team name to a record in stats_map.
     Returns (record, matched_key). If not found, returns (None, None).
+    nickname_index (from build_nickname_index) turns the nickname fallback into a
+    lookup instead of a scan of every key.
     """
     norm = _norm_name(schedule_name)
-    if norm in stats_map:
-        return stats_map[norm], norm
 
-    # Try alias variants
+    # Try the name itself, then its alias variants, in one pass
     for cand in _candidate_keys_for(norm):
-        if cand in stats_map:
-            return stats_map[cand], cand
+        rec = stats_map.get(cand)
+        if rec is not None:
+            return rec, cand
+
+    # Try the alias entry of the longest alias prefix (e.g. "la clippers (h)")
+    canon = _longest_alias_prefix(norm)
+    if canon is not None:
+        for cand in _ALIAS_CANDIDATES[canon]:
+            if cand in stats_map:
+                return stats_map[cand], cand
 
     # Fallback: nickname token match (last token) if unique
     parts = norm.split()
     if parts:
         nickname = parts[-1]
-        candidates = [k for k in stats_map.keys() if nickname in k.split()]
+        if nickname_index is not None:
+            candidates = nickname_index.get(nickname, [])
+        else:
+            candidates = [k for k in stats_map.keys() if nickname in k.split()]
         if len(candidates) == 1:
             k = candidates[0]
             return stats_map[k], k
@@ -173,6 +372,12 @@ def resolve_team_record(stats_map: Dict[str, dict], schedule_name: str) -> Tuple
     return None, None
 
 
+@lru_cache(maxsize=16)
+def _select_stmt(table: str, columns: Tuple[str, ...]) -> TextClause:
+    # Built once per table and reused, so repeat loads skip rebuilding the statement
+    return text(f"SELECT {', '.join(columns)} FROM {table}")
+
+
 def load_player_stats_dataframe(session: Session, timeframe: str) -> pd.DataFrame:
     """
     Load player stats for a timeframe (season_long, last_10, last_5, last_3)
@@ -182,73 +387,19 @@ def load_player_stats_dataframe(session: Session, timeframe: str) -> pd.DataFram
     """
     table = f"player_data.player_stats_{timeframe}"
     
-    query = f"""
-        SELECT 
-            player_id,
-            player,
-            team,
-            age,
-            gp,
-            w,
-            l,
-            min,
-            pts,
-            fgm,
-            fga,
-            fg_pct,
-            three_pm,
-            three_pa,
-            three_p_pct,
-            ftm,
-            fta,
-            ft_pct,
-            oreb,
-            dreb,
-            reb,
-            ast,
-            tov,
-            stl,
-            blk,
-            pf,
-            fp,
-            dd2,
-            tdthree_,
-            plus_minus,
-            offrtg,
-            defrtg,
-            netrtg,
-            ast_pct,
-            ast_to,
-            ast_ratio,
-            oreb_pct,
-            dreb_pct,
-            reb_pct,
-            tov_pct,
-            efg_pct,
-            ts_pct,
-            usg_pct,
-            pace,
-            pie,
-            poss,
-            touches,
-            front_ct_touches,
-            time_of_poss,
-            avg_sec_per_touch,
-            avg_drib_per_touch,
-            pts_per_touch,
-            elbow_touches,
-            post_ups,
-            paint_touches,
-            pts_per_elbow_touch,
-            pts_per_post_touch,
-            pts_per_paint_touch
-        FROM {table}
-    """
-    
-    df = pd.read_sql(text(query), session.connection())
+    df = pd.read_sql(_select_stmt(table, PLAYER_STATS_COLUMNS), session.connection())
     return df
 
 
+def load_player_stats_dataframes_bulk(session: Session, timeframes: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Load player stats for several timeframes in a single round-trip by UNION ALL-ing
+    the player_data.player_stats_{timeframe} tables.
+    Returns {timeframe: DataFrame}, as load_player_stats_dataframe.
+    """
+    return _stats_dataframes_bulk(session, "player_data.player_stats", PLAYER_STATS_COLUMNS, timeframes)
+
+
 def load_team_stats_dataframe(session: Session, timeframe: str) -> pd.DataFrame:
     """
     Load team stats for a timeframe (season_long, last_10, last_5, last_3)
@@ -258,53 +409,41 @@ def load_team_stats_dataframe(session: Session, timeframe: str) -> pd.DataFrame:
     """
     table = f"team_data.team_stats_{timeframe}"
     
-    query = f"""
-        SELECT 
-            team_id,
-            team_name,
-            gp,
-            w,
-            l,
-            min,
-            pts,
-            fgm,
-            fga,
-            fg_pct,
-            three_pm,
-            three_pa,
-            three_p_pct,
-            ftm,
-            fta,
-            ft_pct,
-            oreb,
-            dreb,
-            reb,
-            ast,
-            tov,
-            stl,
-            blk,
-            pf,
-            plus_minus,
-            offrtg,
-            defrtg,
-            netrtg,
-            ast_pct,
-            ast_to,
-            ast_ratio,
-            oreb_pct,
-            dreb_pct,
-            reb_pct,
-            tov_pct,
-            efg_pct,
-            ts_pct,
-            pace,
-            pie,
-            poss
-        FROM {table}
+    df = pd.read_sql(_select_stmt(table, TEAM_STATS_COLUMNS), session.connection())
+    return df
+
+
+def load_team_stats_dataframes_bulk(session: Session, timeframes: Iterable[str]) -> Dict[str, pd.DataFrame]:
     """
-    
+    Load team stats for several timeframes in a single round-trip by UNION ALL-ing
+    the team_data.team_stats_{timeframe} tables.
+    Returns {timeframe: DataFrame}, as load_team_stats_dataframe.
+    """
+    return _stats_dataframes_bulk(session, "team_data.team_stats", TEAM_STATS_COLUMNS, timeframes)
+
+
+def _stats_dataframes_bulk(
+    session: Session, table_prefix: str, columns: Tuple[str, ...], timeframes: Iterable[str]
+) -> Dict[str, pd.DataFrame]:
+    # One UNION ALL over {table_prefix}_{timeframe} tagged with the timeframe, split client-side
+    timeframes = list(timeframes)
+    if not timeframes:
+        return {}
+    select_list = ", ".join(columns)
+    query = "\nunion all\n".join(
+        f"""
+            select '{tf}' as timeframe, {select_list}
+            from {table_prefix}_{tf}
+        """
+        for tf in timeframes
+    )
     df = pd.read_sql(text(query), session.connection())
-    return df
+    groups = dict(iter(df.groupby("timeframe", sort=False)))
+    empty = df.iloc[0:0]
+    return {
+        tf: groups.get(tf, empty).drop(columns="timeframe").reset_index(drop=True)
+        for tf in timeframes
+    }
 
 
 def load_game_matchup_dataframe(session: Session, game_date_est) -> pd.DataFrame:
@@ -2,8 +2,9 @@
 Ingest player projections into the database.
 """
 import argparse
-from typing import Optional
+from typing import Optional, Set
 import pandas as pd
+from sqlalchemy import delete, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 try:
@@ -19,29 +20,47 @@ except ImportError:
     from db.models import PlayerProjection  # type: ignore
 
 
+# Rows per executemany insert batch; keeps each compiled statement and its
+# parameter set bounded regardless of input size
+INSERT_CHUNK_SIZE = 1000
+
+# Engines (by id; get_engine memoizes one per URL) whose projection table has
+# already been checked/created in this process
+_INIT_DONE: Set[int] = set()
+
+
+def _ensure_tables(engine) -> None:
+    # Pay the checkfirst DDL round-trip once per engine instead of on every upsert
+    if id(engine) in _INIT_DONE:
+        return
+    PlayerProjection.__table__.create(bind=engine, checkfirst=True)
+    _INIT_DONE.add(id(engine))
+
+
 def upsert_projections(df: pd.DataFrame, database_url: Optional[str] = None) -> int:
     """
     Save player projections DataFrame to database.
     
     For each unique game_date in the DataFrame:
-    - Deletes all existing projections for that date
-    - Inserts the new projections
+    - Upserts the new projections on (game_date, player, team)
+    - Deletes existing projections for that date that were not part of this run
     
     This ensures clean replacement when re-running projections for the same date
-    (e.g., due to injury updates, minutes changes, etc.)
+    (e.g., due to injury updates, minutes changes, etc.) while rows that are still
+    projected are updated in place.
     
     Args:
         df: DataFrame with player projections (from player_proj.build_projections)
         database_url: Optional database URL
         
     Returns:
-        Number of rows inserted
+        Number of rows inserted or updated
     """
     engine = get_engine(database_url)
     SessionLocal = get_session_maker(engine)
     
     # Ensure table exists
-    PlayerProjection.__table__.create(bind=engine, checkfirst=True)
+    _ensure_tables(engine)
     
     # Convert DataFrame to list of dicts
     # Only include columns that exist in the model
@@ -49,37 +68,58 @@ def upsert_projections(df: pd.DataFrame, database_url: Optional[str] = None) ->
     
     # Filter DataFrame to only include columns that exist in the model
     available_cols = [col for col in model_columns if col in df.columns]
-    df_filtered = df[available_cols].copy()
     
-    # Convert to records
-    records = df_filtered.to_dict('records')
+    # Column selection already yields a new frame; add calc_version as a column
+    # before conversion instead of patching every record dict afterwards
+    records = df[available_cols].assign(calc_version='v1').to_dict('records')
     
     if not records:
         print("No records to insert")
         return 0
     
-    # Add calc_version to all records
-    for record in records:
-        record['calc_version'] = 'v1'
-    
     # Get unique game dates from the data
     unique_dates = df['game_date'].unique()
     
+    table = PlayerProjection.__table__
+    
+    # Upsert on the unique (game_date, player, team) key; every other column is
+    # overwritten and updated_at stamped with this transaction's now()
+    stmt = pg_insert(table)
+    key_cols = ('game_date', 'player', 'team')
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key_cols),
+        set_={
+            col.name: (func.now() if col.name == 'updated_at' else stmt.excluded[col.name])
+            for col in table.columns
+            if col.name not in ('id', 'created_at') + key_cols
+        },
+    )
+    
     with SessionLocal() as session:
-        # Delete existing projections for these dates
-        for game_date in unique_dates:
-            deleted = session.query(PlayerProjection).filter(
-                PlayerProjection.game_date == game_date
-            ).delete()
-            if deleted > 0:
-                print(f"Deleted {deleted} existing projections for {game_date}")
+        # Upsert new projections in 1000-row executemany batches. The executemany
+        # form (statement + list of dicts) lets SQLAlchemy batch rows into
+        # multi-row VALUES itself instead of compiling one giant literal statement.
+        row_count = 0
+        for start in range(0, len(records), INSERT_CHUNK_SIZE):
+            chunk = records[start:start + INSERT_CHUNK_SIZE]
+            session.execute(stmt, chunk)
+            # Every row is inserted or updated, or the statement raises
+            row_count += len(chunk)
         
-        # Insert new projections
-        stmt = pg_insert(PlayerProjection.__table__).values(records)
-        result = session.execute(stmt)
+        # Remaining rows for these dates were not touched by this transaction
+        # (now() is fixed per transaction), i.e. players no longer projected
+        result = session.execute(
+            delete(table).where(
+                table.c.game_date.in_(list(unique_dates)),
+                table.c.updated_at < func.now(),
+            )
+        )
+        deleted = getattr(result, 'rowcount', 0) or 0
+        if deleted > 0:
+            dates = ", ".join(str(d) for d in unique_dates)
+            print(f"Deleted {deleted} stale projections for {dates}")
         session.commit()
         
-        row_count = getattr(result, 'rowcount', 0) or 0
         return row_count
 
 
@@ -7,7 +7,7 @@ from sqlalchemy import text
 
 # Support running as a module and as a script by fixing sys.path when needed
 try:
-    from db.database import get_engine
+    from db.database import copy_rows, get_engine, sql_dtypes
     from stats_retrieval.fetch_and_merge_player_stats import (
         fetch_and_merge_player_stats,
     )
@@ -18,7 +18,7 @@ except ImportError:
     ROOT = Path(__file__).resolve().parents[2]
     if str(ROOT) not in sys.path:
         sys.path.insert(0, str(ROOT))
-    from db.database import get_engine  # type: ignore
+    from db.database import copy_rows, get_engine, sql_dtypes  # type: ignore
     from stats_retrieval.fetch_and_merge_player_stats import (  # type: ignore
         fetch_and_merge_player_stats,
     )
@@ -37,12 +37,24 @@ def upsert_dataframe(df: pd.DataFrame, table_name: str, database_url: str) -> No
     with engine.begin() as conn:
         # Ensure schema exists before writing
         conn.execute(text("CREATE SCHEMA IF NOT EXISTS player_data"))
-        df.to_sql(
+        # (Re)create the table from the frame's columns and dtypes, then bulk
+        # load every row with one COPY instead of per-row INSERT statements.
+        # Date types come from the full frame (head(0) would make them TEXT)
+        df.head(0).to_sql(
             name=table_name,
             con=conn,
             schema="player_data",
             if_exists="replace",
             index=False,
+            dtype=sql_dtypes(df),
+        )
+        # NaN -> NULL, as to_sql writes them
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        copy_rows(
+            conn,
+            f'player_data."{table_name}"',
+            ['"{}"'.format(str(col).replace('"', '""')) for col in df.columns],
+            rows,
         )
 
 
@@ -1,7 +1,7 @@
 import argparse
 import os
 from datetime import datetime
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from zoneinfo import ZoneInfo
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -56,22 +56,55 @@ def parse_events(payload: dict) -> List[dict]:
     return events
 
 
-def to_est_date(commence_time_iso: str, tz_name: str = "America/New_York") -> datetime.date:
+def to_est_date(
+    commence_time_iso: str, tz_name: str = "America/New_York", tz: Optional[ZoneInfo] = None
+) -> datetime.date:
+    # Pass a resolved tz when converting many events to skip the per-call ZoneInfo lookup
     iso_norm = commence_time_iso.replace("Z", "+00:00")
     dt_utc = datetime.fromisoformat(iso_norm)
-    local_dt = dt_utc.astimezone(ZoneInfo(tz_name))
+    local_dt = dt_utc.astimezone(tz or ZoneInfo(tz_name))
     return local_dt.date()
 
 
+def schedule_rows_from_events(events: Iterable[dict], tz_name: str = "America/New_York") -> List[dict]:
+    """
+    game_schedule rows ({game_date_est, away_team, home_team}) for every event with a
+    commence_time and both teams, dated in tz_name (resolved once for the batch).
+    """
+    tz = ZoneInfo(tz_name)
+    return [
+        {
+            "game_date_est": to_est_date(ev["commence_time"], tz=tz),
+            "away_team": ev["away_team"],
+            "home_team": ev["home_team"],
+        }
+        for ev in events
+        if ev.get("commence_time") and ev.get("home_team") and ev.get("away_team")
+    ]
+
+
+SCHEDULE_PAGE_SIZE = 500
+
+
 def upsert_game_schedule(session: Session, rows: Iterable[dict]) -> int:
+    rows = list(rows)
     if not rows:
         return 0
-    stmt = pg_insert(GameSchedule.__table__).values(list(rows))
-    stmt = stmt.on_conflict_do_nothing(
-        index_elements=["game_date_est", "away_team", "home_team"]
+    # executemany form: the driver batches rows into multi-row VALUES pages instead
+    # of compiling one statement with a bind parameter per cell. RETURNING counts
+    # only the rows actually inserted (conflicts are skipped).
+    table = GameSchedule.__table__
+    stmt = (
+        pg_insert(table)
+        .on_conflict_do_nothing(index_elements=["game_date_est", "away_team", "home_team"])
+        .returning(table.c.id)
+    )
+    result = session.execute(
+        stmt,
+        rows,
+        execution_options={"insertmanyvalues_page_size": SCHEDULE_PAGE_SIZE},
     )
-    result = session.execute(stmt)
-    return getattr(result, "rowcount", 0) or 0
+    return len(result.all())
 
 
 def main() -> None:
@@ -126,21 +159,7 @@ def main() -> None:
     payload = fetch_json(url)
     events = parse_events(payload)
 
-    rows = []
-    for ev in events:
-        commence_time = ev.get("commence_time")
-        home_team = ev.get("home_team")
-        away_team = ev.get("away_team")
-        if not (commence_time and home_team and away_team):
-            continue
-        game_date_est = to_est_date(commence_time, tz_name=args.tz)
-        rows.append(
-            {
-                "game_date_est": game_date_est,
-                "away_team": away_team,
-                "home_team": home_team,
-            }
-        )
+    rows = schedule_rows_from_events(events, tz_name=args.tz)
 
     if args.dry_run:
         print(f"Would upsert {len(rows)} rows into game_schedule")
@@ -1,7 +1,9 @@
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 # Import DB infra
 try:
@@ -12,7 +14,7 @@ try:
     from db.db_insert.ingest_today_nba_events_to_db import (
         upsert_game_schedule,
         parse_events,
-        to_est_date,
+        schedule_rows_from_events,
     )
     from odds_api_retrieval.get_today_nba_events import (
         DEFAULT_BASE_API_URL,
@@ -36,7 +38,7 @@ except ImportError:
     from db.db_insert.ingest_today_nba_events_to_db import (  # type: ignore
         upsert_game_schedule,
         parse_events,
-        to_est_date,
+        schedule_rows_from_events,
     )
     from odds_api_retrieval.get_today_nba_events import (  # type: ignore
         DEFAULT_BASE_API_URL,
@@ -58,8 +60,7 @@ def update_game_schedule(
     Fetch today's NBA events (in the provided timezone) and upsert into game_schedule.
     Returns number of inserted rows (conflicts ignored).
     """
-    from zoneinfo import ZoneInfo
-
+    # ZoneInfo keeps its own per-key cache, so repeat calls reuse the parsed zone
     tz = ZoneInfo(tz_name)
     if local_date_str:
         try:
@@ -81,22 +82,10 @@ def update_game_schedule(
     payload = fetch_json(url)
     events = parse_events(payload)
 
-    rows = []
-    for ev in events:
-        commence_time = ev.get("commence_time")
-        home_team = ev.get("home_team")
-        away_team = ev.get("away_team")
-        if not (commence_time and home_team and away_team):
-            continue
-        game_date_est = to_est_date(commence_time, tz_name=tz_name)
-        rows.append(
-            {
-                "game_date_est": game_date_est,
-                "away_team": away_team,
-                "home_team": home_team,
-            }
-        )
+    rows = schedule_rows_from_events(events, tz_name=tz_name)
 
+    # get_engine / get_session_maker are shared per URL, so this reuses the pool
+    # that create_all and the stats ingests draw from
     engine = get_engine(database_url)
     SessionLocal = get_session_maker(engine)
     inserted = 0
@@ -106,6 +95,59 @@ def update_game_schedule(
     return inserted
 
 
+def run(
+    database_url: Optional[str] = None,
+    local_date_str: Optional[str] = None,
+    *,
+    season: str = "2025-26",
+    season_type: str = "Regular Season",
+    per_mode: str = "PerGame",
+    events_base_url: Optional[str] = None,
+    tz_name: str = "America/New_York",
+) -> None:
+    """
+    Run the daily update: ensure tables, then refresh game_schedule and the team and
+    player stats for every timeframe. Defaults match the CLI; database_url and
+    events_base_url fall back to DATABASE_URL / ODDS_API_BASE_URL.
+    """
+    database_url = database_url or os.getenv("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL env var or --database-url must be provided")
+    events_base_url = events_base_url or os.environ.get("ODDS_API_BASE_URL", DEFAULT_BASE_API_URL)
+
+    # 1) Ensure schemas/tables exist
+    print("Ensuring database schemas and tables exist...")
+    create_all(database_url)
+
+    # 2-4) Game schedule (odds API), team stats and player stats (stats.nba.com)
+    # are independent and write disjoint tables, so run them concurrently; the
+    # shared engine pool gives each thread its own connection
+    print("Updating game_schedule and ingesting team & player stats across timeframes...")
+    stats_kwargs = dict(
+        season=season,
+        season_type=season_type,
+        per_mode=per_mode,
+        database_url=database_url,
+    )
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        schedule_future = executor.submit(
+            update_game_schedule,
+            database_url=database_url,
+            base_url=events_base_url,
+            tz_name=tz_name,
+            local_date_str=local_date_str,
+        )
+        team_future = executor.submit(run_team_ingest, **stats_kwargs)
+        player_future = executor.submit(run_player_ingest, **stats_kwargs)
+
+        inserted = schedule_future.result()
+        print(f"Upserted {inserted} rows into game_schedule (conflicts ignored)")
+        team_future.result()
+        player_future.result()
+
+    print("Daily update completed.")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run daily DB update: tables, events, team & player stats")
     parser.add_argument(
@@ -133,43 +175,16 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if not args.database_url:
-        raise RuntimeError("DATABASE_URL env var or --database-url must be provided")
-
-    # 1) Ensure schemas/tables exist
-    print("Ensuring database schemas and tables exist...")
-    create_all(args.database_url)
-
-    # 2) Update game schedule for the day
-    print("Updating game_schedule for the requested day...")
-    inserted = update_game_schedule(
-        database_url=args.database_url,
-        base_url=args.events_base_url,
-        tz_name=args.tz,
-        local_date_str=args.date,
-    )
-    print(f"Upserted {inserted} rows into game_schedule (conflicts ignored)")
-
-    # 3) Ingest team stats across timeframes
-    print("Ingesting team stats across timeframes...")
-    run_team_ingest(
+    run(
+        args.database_url,
+        args.date,
         season=args.season,
         season_type=args.season_type,
         per_mode=args.per_mode,
-        database_url=args.database_url,
-    )
-
-    # 4) Ingest player stats across timeframes
-    print("Ingesting player stats across timeframes...")
-    run_player_ingest(
-        season=args.season,
-        season_type=args.season_type,
-        per_mode=args.per_mode,
-        database_url=args.database_url,
+        events_base_url=args.events_base_url,
+        tz_name=args.tz,
     )
 
-    print("Daily update completed.")
-
 
 if __name__ == "__main__":
     main()
@@ -9,18 +9,21 @@ FastAPI application with scheduled tasks and admin endpoints for:
 import os
 import asyncio
 import datetime
+import functools
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import logging
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from pydantic import BaseModel
+from apscheduler.events import EVENT_ALL
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
-import json
 
 from stats_retrieval.fetch_and_merge_player_stats import fetch_and_merge_player_stats
 from stats_retrieval.fetch_and_merge_team_stats import fetch_and_merge_team_stats
@@ -45,6 +48,10 @@ app = FastAPI(
 # Scheduler for automated tasks
 scheduler = AsyncIOScheduler()
 
+# Dedicated threads for the pipeline jobs, so long-running updates never starve
+# the default threadpool that serves sync endpoints
+job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nba-sharp-job")
+
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -88,25 +95,15 @@ async def run_daily_update(date_str: Optional[str] = None):
         logger.info(f"Starting daily update for date: {date_str or 'today'}")
         
         # Import here to avoid circular imports
-        from db.run_daily_update import main as run_update
-        
-        # Build command args
-        import sys
-        original_argv = sys.argv.copy()
-        
-        args = ["run_daily_update"]
-        if date_str:
-            args.extend(["--date", date_str])
-        if DATABASE_URL:
-            args.extend(["--database-url", DATABASE_URL])
-        
-        sys.argv = args
+        from db.run_daily_update import run as run_update
         
-        # Run in executor to avoid blocking
+        # Run on the job executor to avoid blocking; parameters are passed
+        # directly, so concurrent jobs never share process-wide argv
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, run_update)
+        await loop.run_in_executor(
+            job_executor, functools.partial(run_update, DATABASE_URL, date_str)
+        )
         
-        sys.argv = original_argv
         logger.info("Daily update completed successfully")
         
     except Exception as e:
@@ -119,25 +116,17 @@ async def run_game_matchup(date_str: Optional[str] = None):
     try:
         logger.info(f"Starting game matchup calculations for date: {date_str or 'today'}")
         
-        from analysis.game_matchup import main as run_matchup
-        
-        # Build command args
-        import sys
-        original_argv = sys.argv.copy()
+        from analysis.game_matchup import run as run_matchup
         
-        args = ["game_matchup"]
         if date_str:
-            args.extend(["--date", date_str])
-        if DATABASE_URL:
-            args.extend(["--database-url", DATABASE_URL])
-        
-        sys.argv = args
+            game_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+        else:
+            game_date = datetime.date.today()
         
-        # Run in executor
+        # Run on the job executor
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, run_matchup)
+        await loop.run_in_executor(job_executor, run_matchup, game_date, DATABASE_URL)
         
-        sys.argv = original_argv
         logger.info("Game matchup calculations completed successfully")
         
     except Exception as e:
@@ -167,7 +156,7 @@ async def run_player_projections(date_str: Optional[str] = None):
         # Build projections
         loop = asyncio.get_event_loop()
         df = await loop.run_in_executor(
-            None,
+            job_executor,
             build_projections,
             DAILY_PROJ_PATH,
             game_date,
@@ -177,7 +166,7 @@ async def run_player_projections(date_str: Optional[str] = None):
         
         # Save to CSV
         output_path = DAILY_PROJ_DIR / f"player_projections_{game_date}.csv"
-        await loop.run_in_executor(None, save_projections, df, output_path)
+        await loop.run_in_executor(job_executor, save_projections, df, output_path)
         
         logger.info(f"Player projections completed successfully. Processed {len(df)} players")
         
@@ -252,6 +241,46 @@ async def health_check():
 # Stats Endpoints (existing)
 # ============================================================================
 
+# Serialized stats responses keyed by (kind, season, season_type, per_mode,
+# last_n_games) -> (stored_at, JSON body); identical requests within the TTL skip
+# the NBA API entirely
+STATS_CACHE_TTL_SECONDS = 300
+_stats_cache: Dict[Tuple[str, str, str, str, int], Tuple[float, str]] = {}
+
+
+def _cached_stats_json(
+    kind: str, fetch, season: str, season_type: str, per_mode: str, last_n_games: int
+) -> Optional[str]:
+    """Records JSON for a stats fetch, served from the TTL cache when fresh"""
+    key = (kind, season, season_type, per_mode, last_n_games)
+    now = time.monotonic()
+    hit = _stats_cache.get(key)
+    if hit is not None and now - hit[0] < STATS_CACHE_TTL_SECONDS:
+        return hit[1]
+
+    df = fetch(
+        season=season,
+        season_type=season_type,
+        per_mode=per_mode,
+        last_n_games=last_n_games,
+    )
+    if df is None:
+        return None
+
+    # Serialize once: pandas writes the records JSON directly, and the cached
+    # body is returned as-is on later hits
+    body = df.to_json(orient="records")
+    # Drop expired entries so the cache stays bounded by the distinct live keys
+    expired = [
+        k for k, (stored_at, _) in _stats_cache.items()
+        if now - stored_at >= STATS_CACHE_TTL_SECONDS
+    ]
+    for stale in expired:
+        del _stats_cache[stale]
+    _stats_cache[key] = (now, body)
+    return body
+
+
 @app.get("/api/v1/stats/teams")
 async def get_team_stats(
     season: str = "2025-26",
@@ -259,19 +288,15 @@ async def get_team_stats(
     per_mode: str = "PerGame",
     last_n_games: int = 0,
 ):
-    """Fetch team stats from NBA API"""
+    """Fetch team stats from NBA API (cached for STATS_CACHE_TTL_SECONDS)"""
     try:
-        df = fetch_and_merge_team_stats(
-            season=season,
-            season_type=season_type,
-            per_mode=per_mode,
-            last_n_games=last_n_games,
+        body = _cached_stats_json(
+            "teams", fetch_and_merge_team_stats, season, season_type, per_mode, last_n_games
         )
-        if df is None:
+        if body is None:
             raise HTTPException(status_code=502, detail="Failed to fetch team stats")
 
-        data = json.loads(df.to_json(orient="records"))
-        return JSONResponse(content=data)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as exc:
@@ -285,19 +310,15 @@ async def get_player_stats(
     per_mode: str = "PerGame",
     last_n_games: int = 0,
 ):
-    """Fetch player stats from NBA API"""
+    """Fetch player stats from NBA API (cached for STATS_CACHE_TTL_SECONDS)"""
     try:
-        df = fetch_and_merge_player_stats(
-            season=season,
-            season_type=season_type,
-            per_mode=per_mode,
-            last_n_games=last_n_games,
+        body = _cached_stats_json(
+            "players", fetch_and_merge_player_stats, season, season_type, per_mode, last_n_games
         )
-        if df is None:
+        if body is None:
             raise HTTPException(status_code=502, detail="Failed to fetch player stats")
 
-        data = json.loads(df.to_json(orient="records"))
-        return JSONResponse(content=data)
+        return Response(content=body, media_type="application/json")
     except HTTPException:
         raise
     except Exception as exc:
@@ -427,6 +448,37 @@ async def trigger_full_pipeline(
     )
 
 
+@app.post("/api/v1/admin/cache-clear")
+async def clear_stats_cache():
+    """Drop every cached stats response so the next request refetches from the NBA API"""
+    cleared = len(_stats_cache)
+    _stats_cache.clear()
+    return {"status": "success", "message": f"Cleared {cleared} cached stats responses"}
+
+
+UPLOAD_COPY_BUFSIZE = 1024 * 1024
+# Uploads are sniffed on their first block before anything is written
+UPLOAD_SNIFF_BYTES = 4096
+
+
+def _csv_upload_error(head: bytes) -> Optional[str]:
+    """Why the first block of an upload cannot be a projections CSV (None if plausible)"""
+    if b"\x00" in head:
+        return "File must be a text CSV (found binary content)"
+    header, _, rest = head.partition(b"\n")
+    if b"," not in header:
+        return "File must be a CSV with a comma-separated header row"
+    if not rest.strip():
+        return "File must contain a header row and at least one data row"
+    return None
+
+
+def _save_upload(src, dest: Path) -> None:
+    """Copy an uploaded file object to dest in 1 MiB blocks"""
+    with dest.open("wb") as buffer:
+        shutil.copyfileobj(src, buffer, UPLOAD_COPY_BUFSIZE)
+
+
 @app.post("/api/v1/admin/upload-daily-csv")
 async def upload_daily_csv(
     background_tasks: BackgroundTasks,
@@ -451,12 +503,20 @@ async def upload_daily_csv(
         if not file.filename.endswith('.csv'):
             raise HTTPException(status_code=400, detail="File must be a CSV")
         
+        # Sniff the first block so a wrong or empty file is rejected before it
+        # overwrites the current daily_proj.csv or schedules projections
+        head = await file.read(UPLOAD_SNIFF_BYTES)
+        error = _csv_upload_error(head)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
+        await file.seek(0)
+        
         # Ensure directory exists
         DAILY_PROJ_DIR.mkdir(parents=True, exist_ok=True)
         
-        # Save uploaded file
-        with DAILY_PROJ_PATH.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save uploaded file off the event loop
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, _save_upload, file.file, DAILY_PROJ_PATH)
         
         logger.info(f"Uploaded daily_proj.csv ({file.filename})")
         
@@ -486,23 +546,38 @@ async def upload_daily_csv(
 # Scheduler Endpoints
 # ============================================================================
 
+# Status payload built on first request and reused until the scheduler reports any
+# event (job added/removed/submitted/executed, pause/resume, shutdown), since jobs
+# and their next run times only change at those points
+_scheduler_status: Optional[dict] = None
+
+
+def _invalidate_scheduler_status(event=None) -> None:
+    global _scheduler_status
+    _scheduler_status = None
+
+
+scheduler.add_listener(_invalidate_scheduler_status, EVENT_ALL)
+
+
 @app.get("/api/v1/scheduler/status")
 async def get_scheduler_status():
     """Get scheduler status and upcoming jobs"""
-    jobs = scheduler.get_jobs()
-    
-    return {
-        "running": scheduler.running,
-        "jobs": [
-            {
-                "id": job.id,
-                "name": job.name,
-                "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
-                "trigger": str(job.trigger)
-            }
-            for job in jobs
-        ]
-    }
+    global _scheduler_status
+    if _scheduler_status is None:
+        _scheduler_status = {
+            "running": scheduler.running,
+            "jobs": [
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
+                    "trigger": str(job.trigger)
+                }
+                for job in scheduler.get_jobs()
+            ]
+        }
+    return _scheduler_status
 
 
 @app.post("/api/v1/scheduler/pause")
@@ -555,6 +630,7 @@ async def shutdown_event():
     logger.info("Shutting down...")
     scheduler.shutdown()
     logger.info("Scheduler stopped")
+    job_executor.shutdown(wait=False)
 
 
 # ============================================================================
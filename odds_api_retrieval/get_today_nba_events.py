@@ -1,4 +1,5 @@
 import argparse
+import gzip
 import json
 import os
 from datetime import datetime, timedelta, timezone
@@ -59,10 +60,13 @@ def build_events_url(
 
 
 def fetch_json(url: str, timeout_seconds: int = 20) -> dict:
-    req = Request(url, headers={"Accept": "application/json"})
+    # Ask for a gzip-compressed body; urllib does not decode it, so do it here
+    req = Request(url, headers={"Accept": "application/json", "Accept-Encoding": "gzip"})
     with urlopen(req, timeout=timeout_seconds) as resp:
         content_type = resp.headers.get("Content-Type", "")
         data = resp.read()
+        if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+            data = gzip.decompress(data)
         if "application/json" not in content_type:
             # Fallback: attempt to parse regardless
             return json.loads(data.decode("utf-8"))
@@ -0,0 +1,217 @@
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from db.database import copy_rows, get_engine, sql_dtypes
+
+# stats.nba.com throttles bursts, so request starts are spaced across every
+# worker thread in the process (player and team fetches share the budget)
+MIN_REQUEST_INTERVAL = 0.2  # seconds, i.e. at most 5 requests/s
+FETCH_WORKERS = 4
+
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+# On-disk copy of each endpoint response, keyed by endpoint and parameters; a
+# re-run within the TTL (e.g. a manual update after the noon job) skips the network
+RESPONSE_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "nba_sharp" / "nba_api"
+)
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+
+def throttle() -> None:
+    """Block until this thread may start the next stats.nba.com request."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        start_at = max(now, _next_request_at)
+        _next_request_at = start_at + MIN_REQUEST_INTERVAL
+    if start_at > now:
+        time.sleep(start_at - now)
+
+
+def _response_cache_path(endpoint_cls, params: Dict[str, Any]) -> Path:
+    key = json.dumps({"endpoint": endpoint_cls.__name__, **params}, sort_keys=True, default=str)
+    return RESPONSE_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+
+def _read_cached_frame(path: Path) -> Optional[pd.DataFrame]:
+    try:
+        if time.time() - path.stat().st_mtime < RESPONSE_CACHE_TTL_SECONDS:
+            return pd.read_pickle(path)
+    except Exception:
+        # Missing, expired or unreadable entries are simply refetched
+        pass
+    return None
+
+
+def _write_cached_frame(path: Path, df: pd.DataFrame) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not cache stats response at {path}: {e}")
+
+
+def _fetch_first_frame(label: str, endpoint_cls, params: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    cache_path = _response_cache_path(endpoint_cls, params)
+    cached = _read_cached_frame(cache_path)
+    if cached is not None:
+        print(f"Using cached '{label}' stats")
+        return cached
+
+    print(f"Fetching '{label}' stats...")
+    throttle()
+    try:
+        df = endpoint_cls(**params).get_data_frames()[0]
+    except Exception as e:
+        print(f"Error fetching '{label}' stats: {e}")
+        return None
+    _write_cached_frame(cache_path, df)
+    return df
+
+
+def fetch_frames(
+    requests: Sequence[Tuple[str, Any, Dict[str, Any]]], max_workers: int = FETCH_WORKERS
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Run (label, endpoint_cls, params) requests concurrently on a thread pool.
+
+    Returns {label: first result set as a DataFrame, or None if the request failed},
+    in request order so callers merge deterministically.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            (label, pool.submit(_fetch_first_frame, label, endpoint_cls, params))
+            for label, endpoint_cls, params in requests
+        ]
+        return {label: future.result() for label, future in futures}
+
+
+def _unique_on(df: pd.DataFrame, label: str) -> pd.DataFrame:
+    """
+    Keep the first row per index value. A key repeated on both sides of the join
+    would multiply rows (and compound across every joined endpoint), so duplicates
+    are dropped with a warning instead of silently corrupting the output.
+    """
+    duplicated = df.index.duplicated()
+    if duplicated.any():
+        print(f"Warning: dropping {int(duplicated.sum())} duplicate rows from '{label}' stats")
+        return df[~duplicated]
+    return df
+
+
+def fetch_and_merge(
+    requests: Sequence[Tuple[str, Any, Dict[str, Any]]],
+    merge_key: str,
+    column_mapping: Mapping[str, str],
+    schema_columns: Sequence[str],
+) -> Optional[pd.DataFrame]:
+    """
+    Shared fetch/merge/rename/filter pipeline behind the player and team fetchers.
+
+    requests are (label, endpoint_cls, params) with 'Base' first; Base is the main
+    dataframe and every other frame is joined onto it by merge_key. API columns are
+    renamed through column_mapping, current_date is added, and the result holds the
+    schema_columns that were fetched, in that order. Returns None if Base fails.
+    """
+    frames = fetch_frames(requests)
+
+    final_df = frames.pop('Base')
+    if final_df is None:
+        return None
+
+    # Project every frame down to the API columns column_mapping keeps, index it on
+    # merge_key and join all of them onto Base in one pass: one index alignment
+    # instead of a hash merge and a full copy per endpoint. Frames are taken in
+    # request order and failed fetches are skipped; each contributes only the
+    # columns no earlier frame had (so keys and common stats like GP, MIN come
+    # from Base).
+    final_df = final_df[[col for col in final_df.columns if col in column_mapping]]
+    seen_cols = set(final_df.columns)
+    extra_frames = []
+    for label, new_df in frames.items():
+        if new_df is None:
+            continue
+        cols_to_add = [
+            col for col in new_df.columns if col in column_mapping and col not in seen_cols
+        ]
+        seen_cols.update(cols_to_add)
+        extra_frames.append(_unique_on(new_df.set_index(merge_key)[cols_to_add], label))
+    if extra_frames:
+        final_df = (
+            _unique_on(final_df.set_index(merge_key), 'Base')
+            .join(extra_frames, how='left')
+            .reset_index()
+        )
+
+    print("All data fetched. Renaming columns to match schema...")
+    # Every column left is in column_mapping. Several API names can map to one
+    # schema name (player TM_TOV_PCT from Advanced and TOV_PCT from Usage both ->
+    # tov_pct); keep only the last, so the later endpoint wins instead of the
+    # output carrying two same-named columns.
+    schema_names = [column_mapping[col] for col in final_df.columns]
+    last_position = {name: i for i, name in enumerate(schema_names)}
+    keep = [i for i, name in enumerate(schema_names) if last_position[name] == i]
+    if len(keep) < len(schema_names):
+        final_df = final_df.iloc[:, keep].copy()
+    final_df.columns = [schema_names[i] for i in keep]
+    final_df['current_date'] = datetime.date.today()
+
+    # Filter to only the schema columns we successfully fetched, in schema order
+    available_columns = [col for col in schema_columns if col in final_df.columns]
+    final_df_filtered = final_df[available_columns]
+
+    print(f"Data processing complete. {len(final_df_filtered.columns)} columns prepared for SQL.")
+    return final_df_filtered
+
+
+def load_frame(df: Optional[pd.DataFrame], schema: str, table_name: str, connection_string: str) -> None:
+    """
+    Replace schema.table_name with df: DDL from the frame's columns and dtypes (date
+    columns typed from the full frame), then every row in one COPY, in a single
+    transaction on the shared per-URL engine.
+    """
+    if df is None:
+        print("No data to load.")
+        return
+
+    try:
+        engine = get_engine(connection_string)
+        print("Connecting to PostgreSQL...")
+
+        with engine.begin() as conn:
+            # Date types come from the full frame (head(0) would make them TEXT)
+            df.head(0).to_sql(
+                name=table_name,
+                con=conn,
+                schema=schema,
+                if_exists='replace',
+                index=False,
+                dtype=sql_dtypes(df)
+            )
+            # NaN -> NULL, as to_sql writes them
+            rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            copy_rows(
+                conn,
+                f'{schema}."{table_name}"',
+                ['"{}"'.format(str(col).replace('"', '""')) for col in df.columns],
+                rows,
+            )
+
+        print(f"Successfully loaded {len(df)} rows into {schema}.{table_name}.")
+
+    except Exception as e:
+        print(f"An error occurred during database operation: {e}")